@@ -0,0 +1,69 @@
+"""Decoded, resized and re-encoded image assets, cached for the whole process.
+
+Images are downsized to the width they are displayed at and encoded once, so
+a rerun hands Streamlit bytes that need no further decode or resize work.
+They are encoded as JPEG (PNG when they have transparency), formats
+``st.image`` serves as they are; it would convert WEBP to JPEG on every rerun.
+"""
+
+import hashlib
+import io
+import os
+import threading
+from collections import namedtuple
+
+from PIL import Image
+
+from manifest import asset_path
+
+DISPLAY_WIDTH = 800
+IMAGES = ("cancer1.webp", "cancer.jpg", "eso.webp")
+
+_MIMETYPES = {"JPEG": "image/jpeg", "PNG": "image/png"}
+
+ImageAsset = namedtuple("ImageAsset", "name data mimetype etag width height")
+
+_cache = {}  # (name, width, mtime_ns) -> ImageAsset
+_preloaded = False
+_lock = threading.Lock()
+
+
+def get_image(name, width=DISPLAY_WIDTH):
+    """Return the cached ``ImageAsset`` for ``name`` resized to ``width``."""
+    path = asset_path(name)
+    key = (name, width, os.stat(path).st_mtime_ns)
+    asset = _cache.get(key)
+    if asset is None:
+        asset = _build(path, name, width)
+        with _lock:
+            for stale in [k for k in _cache if k[:2] == key[:2] and k != key]:
+                del _cache[stale]
+            asset = _cache.setdefault(key, asset)
+    return asset
+
+
+def preload(width=DISPLAY_WIDTH):
+    """Encode every image once per process; later calls return at once."""
+    global _preloaded
+    if not _preloaded:
+        for name in IMAGES:
+            get_image(name, width)
+        _preloaded = True
+
+
+def _build(path, name, width):
+    with Image.open(path) as img:
+        img.load()
+        transparent = img.mode in ("RGBA", "LA") or "transparency" in img.info
+        fmt = "PNG" if transparent else "JPEG"
+        if img.width > width:
+            height = max(1, round(img.height * width / img.width))
+            img = img.resize((width, height), Image.LANCZOS)
+        if fmt == "JPEG" and img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        buf = io.BytesIO()
+        img.save(buf, format=fmt, quality=85)
+        size = img.size
+    data = buf.getvalue()
+    etag = '"%s"' % hashlib.sha256(data).hexdigest()[:32]
+    return ImageAsset(name, data, _MIMETYPES[fmt], etag, *size)
@@ -0,0 +1,181 @@
+"""Benchmarks for the dashboard's hot paths, with a saved baseline to compare against.
+
+Usage: python benchmarks.py [--sizes 25,10000,...] [--filter TEXT] [--repeat N]
+                            [--save FILE] [--compare FILE] [--threshold RATIO]
+
+Groups:
+  load/<cancer>        parse and normalize each CSV (uncached) and a cached load
+  chart/<page>/<id>/N  build every registry chart on N synthetic rows
+  serialize/<page>/<id>/N/<encoding>
+                       encode that chart with Plotly's default JSON encoder
+                       and with serialize.py's fast and typed-array paths;
+                       results also record the encoded size in bytes
+  app/<cancer>         a full headless script run through Streamlit's AppTest
+
+A benchmark that raises is recorded with its error and the others still run.
+--compare exits with status 1 when any benchmark failed or its median is
+slower than the baseline by more than --threshold (default 1.25x).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import timeit
+
+import pandas as pd
+import plotly.io as pio
+
+from cube import build_cube
+from data_loader import invalidate, load_dataset, normalize
+from datasets import CANCER_FILES, DATA_DIR
+from downsample import is_large
+from figures import build_figure
+from manifest import dataset_path
+from registry import PAGES
+from serialize import browser_json, figure_json
+from synthetic import generate
+
+DEFAULT_SIZES = (25, 10_000, 1_000_000, 10_000_000)
+
+
+def load_benchmarks():
+    for cancer_type in CANCER_FILES:
+        path = dataset_path(cancer_type)
+        yield f"load/{cancer_type}/parse", lambda path=path: normalize(pd.read_csv(path))
+        invalidate(path)
+        load_dataset(path)
+        yield f"load/{cancer_type}/cached", lambda path=path: load_dataset(path)
+
+
+def chart_benchmarks(sizes):
+    for size in sizes:
+        df = generate(size)
+        cube = build_cube(df)
+        yield f"cube/{size}", lambda df=df: build_cube(df)
+        for page in PAGES:
+            for spec in page.charts:
+                needs_cube = spec.rollup or is_large(df)
+                yield (f"chart/{page.name}/{spec.chart_id}/{size}",
+                       lambda spec=spec, df=df, cube=cube if needs_cube else None:
+                       build_figure(spec, df, cube))
+
+
+def serialize_benchmarks(sizes):
+    encoders = {
+        "plotly_json": lambda fig: pio.to_json(fig, validate=False, engine="json"),
+        "fast": figure_json,
+        "typed_arrays": browser_json,
+    }
+    for size in sizes:
+        df = generate(size)
+        cube = build_cube(df)
+        for page in PAGES:
+            for spec in page.charts:
+                try:
+                    fig = build_figure(spec, df, cube if spec.rollup or is_large(df) else None)
+                    chart_encoders = encoders
+                except Exception as exc:
+                    # Record the failure under every encoding instead of ending the group.
+                    fig, chart_encoders = None, dict.fromkeys(encoders, _raiser(exc))
+                for encoding, encode in chart_encoders.items():
+                    yield (f"serialize/{page.name}/{spec.chart_id}/{size}/{encoding}",
+                           lambda encode=encode, fig=fig: encode(fig))
+
+
+def app_benchmarks():
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        print("streamlit.testing unavailable; skipping app benchmarks", file=sys.stderr)
+        return
+    for cancer_type in CANCER_FILES:
+        def run(cancer_type=cancer_type):
+            app = AppTest.from_file(os.path.join(DATA_DIR, "index.py"), default_timeout=60)
+            app.run()
+            app.sidebar.selectbox[0].select(cancer_type).run()
+            if app.exception:
+                raise RuntimeError(f"{cancer_type}: {app.exception}")
+        yield f"app/{cancer_type}", run
+
+
+def _raiser(exc):
+    """A benchmark function that fails with ``exc``, raised while setting it up."""
+    def run(*args):
+        raise exc
+    return run
+
+
+def run_benchmarks(sizes, name_filter=None, repeat=5):
+    results = {}
+    groups = (load_benchmarks(), chart_benchmarks(sizes), serialize_benchmarks(sizes),
+              app_benchmarks())
+    for group in groups:
+        for name, func in group:
+            if name_filter and name_filter not in name:
+                continue
+            started = time.perf_counter()
+            try:
+                output = func()
+            except Exception as exc:
+                results[name] = {"error": f"{type(exc).__name__}: {exc}"}
+                print(f"{name:70s} FAILED {results[name]['error']}")
+                continue
+            first = time.perf_counter() - started
+            # One run is enough to time the multi-second cases reliably.
+            runs = [first] + (timeit.repeat(func, number=1, repeat=repeat - 1) if first < 1 else [])
+            results[name] = {"median_s": statistics.median(runs), "min_s": min(runs), "runs": len(runs)}
+            size = ""
+            if isinstance(output, (str, bytes)):
+                results[name]["bytes"] = len(output)
+                size = f" {len(output):>12,} bytes"
+            print(f"{name:70s} {results[name]['median_s'] * 1000:10.2f} ms{size}")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Names of benchmarks slower than ``threshold`` times their baseline median."""
+    regressions = []
+    for name, result in results.items():
+        if "error" in result:
+            regressions.append(name)
+            print(f"FAILED {name}: {result['error']}")
+            continue
+        base = baseline.get(name)
+        if base is None or "median_s" not in base:
+            continue
+        ratio = result["median_s"] / max(base["median_s"], 1e-9)
+        if ratio > threshold:
+            regressions.append(name)
+            print(f"REGRESSION {name}: {ratio:.2f}x baseline")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated synthetic row counts")
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", metavar="FILE", help="write results as a baseline")
+    parser.add_argument("--compare", metavar="FILE", help="baseline to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    results = run_benchmarks(sizes, args.filter, args.repeat)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Build a static, server-free version of the dashboard.
+
+Usage: python build_site.py [--out DIR] [--jobs N]
+
+The site has the same header, About text, cancer descriptions, charts and
+knowledge sections as the Streamlit app. Every page's Plotly figures are
+embedded as JSON, with numeric arrays as base64 typed arrays, in a single
+index.html with a client-side cancer switcher, and images are the
+pre-resized assets under content-hashed names, so the output can be served
+from any static file server or CDN with long-lived caching. The Streamlit
+app stays the place for interactive analysis.
+"""
+
+import argparse
+import html
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from plotly.utils import PlotlyJSONEncoder
+
+from assets import get_image
+from content import ABOUT_TEXT, FRAGMENTS, PURPOSE_HTML, TITLE_HTML
+from datasets import CANCER_FILES, DATA_DIR
+from export import PLOTLY_JS, build_bundle, slug
+from manifest import ManifestError, get_manifest
+from serialize import browser_figure
+
+SITE_DIR = os.path.join(DATA_DIR, "site")
+BANNER = "cancer1.webp"
+_EXTENSIONS = {"image/jpeg": ".jpg", "image/png": ".png"}
+
+SITE_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Comparative Oncology Data Analysis</title>
+<script src="{plotly_js}"></script>
+</head>
+<body style="max-width:960px; margin:auto; padding:1rem; font-family:sans-serif;">
+{title}
+<img src="{banner}" width="{banner_width}" height="{banner_height}" alt=""
+     style="display:block; max-width:100%; height:auto; margin:auto;">
+<h3>About</h3>
+<p>{about}</p>
+{purpose}
+<p><label>Select Cancer Type
+<select id="cancer">{options}</select></label></p>
+<h3 id="name"></h3>
+<pre id="description" style="white-space:pre-wrap;"></pre>
+<div id="fig1"></div>
+<div id="fig2"></div>
+<div id="knowledge"></div>
+<script type="application/json" id="pages">{pages}</script>
+<script>
+const pages = JSON.parse(document.getElementById("pages").textContent);
+const select = document.getElementById("cancer");
+function show(slug) {{
+  const page = pages[slug] || pages[select.options[0].value];
+  select.value = page.slug;
+  document.getElementById("name").textContent = page.name;
+  document.getElementById("description").textContent = page.description;
+  page.figures.forEach((fig, i) => Plotly.react("fig" + (i + 1), fig.data, fig.layout, {{responsive: true}}));
+  document.getElementById("knowledge").innerHTML = page.knowledge;
+}}
+select.addEventListener("change", () => {{ location.hash = select.value; }});
+window.addEventListener("hashchange", () => show(location.hash.slice(1)));
+show(location.hash.slice(1));
+</script>
+</body>
+</html>
+"""
+
+
+def page_payload(cancer_type):
+    """Everything the client needs to show one cancer; runs in a worker process."""
+    page, figures = build_bundle(cancer_type)
+    return {
+        "slug": slug(cancer_type),
+        "name": page.name,
+        "description": page.description,
+        "figures": [browser_figure(fig) for fig in figures],
+        "knowledge": FRAGMENTS[cancer_type],
+    }
+
+
+def write_asset(asset, out_dir):
+    """Write an image under a content-hashed name and return its relative URL."""
+    name = "%s.%s%s" % (os.path.splitext(asset.name)[0], asset.etag.strip('"')[:12],
+                        _EXTENSIONS[asset.mimetype])
+    os.makedirs(os.path.join(out_dir, "assets"), exist_ok=True)
+    with open(os.path.join(out_dir, "assets", name), "wb") as f:
+        f.write(asset.data)
+    return "assets/" + name
+
+
+def build_site(out_dir=SITE_DIR, jobs=None):
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        payloads = list(pool.map(page_payload, CANCER_FILES))
+
+    if os.path.isdir(out_dir):
+        shutil.rmtree(out_dir)
+    os.makedirs(out_dir)
+    banner = get_image(BANNER)
+    pages = json.dumps({p["slug"]: p for p in payloads}, cls=PlotlyJSONEncoder,
+                       ensure_ascii=False, separators=(",", ":"))
+    options = "".join(f'<option value="{p["slug"]}">{html.escape(p["name"])}</option>'
+                      for p in payloads)
+    document = SITE_HTML.format(
+        plotly_js=PLOTLY_JS,
+        title=TITLE_HTML, banner=write_asset(banner, out_dir),
+        banner_width=banner.width, banner_height=banner.height,
+        about=html.escape(ABOUT_TEXT), purpose=PURPOSE_HTML, options=options,
+        # A literal "</" would end the surrounding <script> element early.
+        pages=pages.replace("</", "<\\/"))
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(document)
+    return out_dir
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=SITE_DIR, help="output directory")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPUs)")
+    args = parser.parse_args(argv)
+    try:
+        get_manifest()
+    except ManifestError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    build_site(args.out, args.jobs)
+    print(f"built {args.out} in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Vectorized cross-cancer aggregation for the comparison view."""
+
+import threading
+from functools import lru_cache
+
+import pandas as pd
+
+from data_loader import current_store, dataset_version, load_cancer
+from datasets import CANCER_FILES
+from store import get_store
+
+# Ranking direction per metric: a lower death rate ranks first.
+HIGHER_IS_BETTER = {"%Cure": True, "Survival_Rate": True, "Death_Rate": False}
+
+_combined = None  # (versions, frame)
+_lock = threading.Lock()
+
+
+def data_versions():
+    return tuple(dataset_version(cancer_type) for cancer_type in CANCER_FILES)
+
+
+def combined_frame():
+    """All datasets in one frame with a Cancer_Type column."""
+    global _combined
+    versions = data_versions()
+    with _lock:
+        if _combined is None or _combined[0] != versions:
+            store = get_store()
+            if store is not None and all(current_store(c) is store for c in CANCER_FILES):
+                frame = store.frame
+            else:
+                frame = pd.concat(
+                    [load_cancer(cancer_type).assign(Cancer_Type=cancer_type)
+                     for cancer_type in CANCER_FILES],
+                    ignore_index=True)
+                frame["Cancer_Type"] = pd.Categorical(frame["Cancer_Type"], categories=list(CANCER_FILES))
+            _combined = (versions, frame)
+        return _combined[1]
+
+
+def compare(frame, metric, by=None):
+    """Mean, spread and rank of ``metric`` per cancer, optionally split by a dimension.
+
+    Ranks are computed within each ``by`` group, 1 being the best value.
+    """
+    keys = ["Cancer_Type"] + ([by] if by else [])
+    # Metrics are stored as float32; summarize them in float64.
+    frame = frame.astype({metric: "float64"})
+    stats = (frame.groupby(keys, observed=True)[metric]
+             .agg(["mean", "std", "min", "max", "count"])
+             .reset_index())
+    # Plain labels, so charts do not show categories absent from the selection.
+    stats[keys] = stats[keys].astype(str)
+    ranked = stats.groupby(by, observed=True)["mean"] if by else stats["mean"]
+    stats["rank"] = ranked.rank(ascending=not HIGHER_IS_BETTER[metric], method="min").astype(int)
+    return stats.sort_values(keys[1:] + ["rank"], ignore_index=True)
+
+
+def pivot(stats, by):
+    """Cancer x ``by`` table of means, for heatmaps."""
+    return stats.pivot(index="Cancer_Type", columns=by, values="mean")
+
+
+@lru_cache(maxsize=64)
+def _cached_compare(versions, metric, by, cancer_types):
+    frame = combined_frame()
+    if cancer_types is not None:
+        frame = frame[frame["Cancer_Type"].isin(cancer_types)]
+    return compare(frame, metric, by)
+
+
+def comparison(metric, by=None, cancer_types=None):
+    """``compare`` over the selected datasets, cached per selection and data version."""
+    if cancer_types is not None:
+        cancer_types = tuple(sorted(cancer_types))
+    return _cached_compare(data_versions(), metric, by, cancer_types)
@@ -0,0 +1,75 @@
+"""Preloaded knowledge content with pre-rendered HTML fragments.
+
+knowledge.json is read once per process and every cancer's heading plus its
+Symptoms/Effects/Causes/Treatments sections are rendered into a single HTML
+fragment. The sections are native ``<details>`` elements, so the browser
+opens them without a rerun and a page sends one markdown delta instead of
+four expanders with four bodies.
+"""
+
+import html
+import json
+import os
+
+from datasets import DATA_DIR
+from registry import REGISTRY
+
+KNOWLEDGE_FILE = os.path.join(DATA_DIR, "knowledge.json")
+SECTION_KINDS = ("Symptoms", "Effects", "Causes", "Treatments")
+
+TITLE_HTML = "<h1 style='text-align: center;'>Comparative Oncology Data Analysis</h1>"
+ABOUT_TEXT = (
+    "Cancer is a disease in which some of the body’s cells grow and "
+    "multiply in an uncontrolled way. Unlike normal cells, which grow, "
+    "divide, and die in an orderly manner, cancer cells keep dividing and "
+    "can form a lump called a tumor (except in cancers of the blood, like "
+    "leukemia). These abnormal cells can spread to other parts of the body "
+    "through the blood or lymph system, a process known as metastasis. "
+    "Cancer is not a single illness but a group of related diseases, and it "
+    "can affect almost any organ or tissue in the body"
+)
+PURPOSE_HTML = """
+    <div style='background-color:#F0F8FF; padding:15px; border-radius:10px;'>
+    <h4 style='color:#2C7BE5;'>🎯 Project Purpose</h4>
+    <p style='color:#000000;'>
+    The purpose of this project is to analyze and compare multiple types of cancers 
+    across different age groups, genders, and stages. By studying survival rates, 
+    cure percentages, and mortality trends, this analysis aims to uncover insights 
+    that can support research, awareness, and healthcare decision-making.
+    </p>
+    </div>
+    """
+
+HEADING_HTML = (
+    "<h3 style='text-align:center; color:#00008B; font-family: Playfair Display;'>"
+    " All You Need to Know About {} </h3>"
+)
+SECTION_HTML = (
+    "<details style='border:1px solid rgba(49,51,63,0.2); border-radius:0.5rem;"
+    " padding:0.5rem 1rem; margin-bottom:0.75rem;'>"
+    "<summary style='cursor:pointer;'>{title}</summary>"
+    "<ul style='margin-top:0.5rem;'>{items}</ul></details>"
+)
+
+
+def load_knowledge(path=KNOWLEDGE_FILE):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def section_title(page, kind):
+    return f"{kind} of {page.topic}"
+
+
+def render_fragment(page, sections):
+    """Return the heading and all sections of ``page`` as one HTML string."""
+    parts = [HEADING_HTML.format(html.escape(page.heading))]
+    for kind in SECTION_KINDS:
+        items = "".join(f"<li>{html.escape(b)}</li>" for b in sections[kind])
+        parts.append(SECTION_HTML.format(
+            title=html.escape(section_title(page, kind)), items=items))
+    return "\n".join(parts)
+
+
+KNOWLEDGE = load_knowledge()
+FRAGMENTS = {name: render_fragment(page, KNOWLEDGE[name]) for name, page in REGISTRY.items()}
@@ -0,0 +1,198 @@
+"""Precomputed Age_Group x Gender x Stage_of_Cancer aggregate cube per cancer.
+
+For every subset of the three dimensions (including the grand total) the cube
+holds sum, mean, count, min and max of each metric. Charts and filters read a
+rollup table or a single cell from it instead of grouping the raw rows.
+Rollup rows follow the order in which each category first appears in the
+rows, as Plotly Express orders raw rows, so a rollup chart gives every
+category the same axis position and colour as a raw-row chart.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from datasets import DIMENSIONS, METRICS
+from profiling import span
+
+AGGREGATES = ("sum", "mean", "count", "min", "max")
+# Aggregates kept in partials; sums and counts add up, min/max fold as such
+# and the mean is derived from sum and count.
+_PARTIALS = ("sum", "count", "min", "max")
+_COLUMNS = pd.MultiIndex.from_product([METRICS, AGGREGATES])
+
+MAX_ENTRIES = int(os.environ.get("CANCER_CUBE_MAX_ENTRIES", 32))
+
+# (cancer_type, data_version) -> Cube of every row. Filtered selections use
+# ``selection_cube`` and never replace it.
+_cubes = OrderedDict()
+_building = {}  # (cancer_type, data_version) -> Lock held while that cube is built
+_lock = threading.Lock()
+
+
+class Cube:
+
+    def __init__(self, partials, order=None):
+        # Partials per Age_Group x Gender x Stage cell (see partial_aggregates),
+        # and the category order of ``appearance_order`` for the rollup rows.
+        self.partials = partials
+        self.order = order
+        # (dimension, ...) -> frame indexed by those dimensions with
+        # (metric, aggregate) columns; () is the one-row grand total. Filled
+        # in as rollups are first asked for.
+        self.tables = {}
+
+    def table(self, dims=(), agg="sum"):
+        """Rollup over ``dims`` with one column per metric holding ``agg``."""
+        table = self.rollup(_key(dims)).xs(agg, axis=1, level=1)
+        return table.reset_index() if dims else table.reset_index(drop=True)
+
+    def value(self, metric, agg="mean", **coords):
+        """One cell, e.g. ``value("Survival_Rate", Gender="Male", Stage_of_Cancer="Stage I")``."""
+        dims = _key(coords)
+        table = self.rollup(dims)
+        if not dims:
+            return table[(metric, agg)].iloc[0]
+        index = tuple(coords[d] for d in dims)
+        return table.at[index if len(index) > 1 else index[0], (metric, agg)]
+
+    def rollup(self, dims):
+        """The table of ``dims`` (in cube order), folding it from the partials on first use."""
+        table = self.tables.get(dims)
+        if table is None:
+            table = self.tables[dims] = _rollup(self.partials, dims, self.order)
+        return table
+
+    def restrict(self, categories, order=None):
+        """The cube of the cells whose categories ``((dimension, (value, ...)), ...)`` keep."""
+        kept = np.ones(len(self.partials), dtype=bool)
+        for dim, values in categories:
+            kept &= self.partials.index.get_level_values(dim).isin(values)
+        return Cube(self.partials[kept], order or self.order)
+
+
+def partial_aggregates(df):
+    """Sum, count, min and max of every metric per Age_Group x Gender x Stage cell.
+
+    Partials of separate chunks can be combined with ``fold_partials``, which is
+    how the streaming ingest builds an exact cube without holding all rows.
+    """
+    partials = df.groupby(list(DIMENSIONS), observed=True)[list(METRICS)].agg(list(_PARTIALS))
+    # Metrics are float32; fold sums across chunks in float64 so they stay exact.
+    return partials.astype("float64")
+
+
+def fold_partials(*partials):
+    """Combine partial aggregates of disjoint row sets into one."""
+    combined = pd.concat(partials)
+    folded = _fold(combined.groupby(level=list(range(len(DIMENSIONS))), observed=True))
+    return folded.reindex(columns=combined.columns)
+
+
+def cube_from_partials(partials, order=None):
+    """The cube of ``partials`` with every rollup computed, its rows in ``order`` if given."""
+    cube = Cube(partials, order)
+    for size in range(len(DIMENSIONS) + 1):
+        for dims in combinations(DIMENSIONS, size):
+            cube.rollup(dims)
+    return cube
+
+
+def appearance_order(df):
+    """``{dimension: [category, ...]}`` in the order the categories first occur in ``df``."""
+    return {dim: list(pd.unique(df[dim])) for dim in DIMENSIONS}
+
+
+def build_cube(df):
+    return cube_from_partials(partial_aggregates(df), appearance_order(df))
+
+
+def get_cube(cancer_type, df, data_version, partials=None):
+    """Return the cube for ``cancer_type``, building it once per data version.
+
+    ``partials`` from a streaming ingest take precedence over aggregating ``df``.
+    """
+    key = (cancer_type, data_version)
+    with _lock:
+        cube = _cubes.get(key)
+        if cube is not None:
+            _cubes.move_to_end(key)
+            return cube
+        building = _building.setdefault(key, threading.Lock())
+    # Charts of one page are built concurrently; only the first one aggregates.
+    with building:
+        with _lock:
+            cube = _cubes.get(key)
+            if cube is not None:
+                return cube
+        with span("aggregate"):
+            if partials is not None:
+                cube = cube_from_partials(partials, appearance_order(df))
+            else:
+                cube = build_cube(df)
+        with _lock:
+            _cubes[key] = cube
+            _building.pop(key, None)
+            while len(_cubes) > MAX_ENTRIES:
+                _cubes.popitem(last=False)
+    return cube
+
+
+def selection_cube(cancer_type, df, data_version, selection):
+    """A cube of ``df``, the rows of ``selection``, that folds only the rollups charts ask for.
+
+    A selection of categories alone is cut out of the cached unfiltered cube
+    of ``data_version``; otherwise the selected rows are aggregated once.
+    """
+    with _lock:
+        full = _cubes.get((cancer_type, data_version))
+    order = appearance_order(df)
+    if full is not None and not selection.ranges:
+        return full.restrict(selection.categories, order)
+    return Cube(partial_aggregates(df), order)
+
+
+def invalidate(cancer_type=None):
+    with _lock:
+        if cancer_type is None:
+            _cubes.clear()
+        else:
+            for key in [k for k in _cubes if k[0] == cancer_type]:
+                del _cubes[key]
+
+
+def _fold(obj):
+    """Fold partials: a frame gives a Series, a groupby over one gives a frame."""
+    def columns(*aggs):
+        return [(m, a) for m in METRICS for a in aggs]
+    parts = [obj[columns("sum", "count")].sum(), obj[columns("min")].min(), obj[columns("max")].max()]
+    return pd.concat(parts, axis=0 if isinstance(obj, pd.DataFrame) else 1)
+
+
+def _rollup(partials, dims, order):
+    if dims:
+        table = _fold(partials.groupby(level=list(dims), observed=True))
+        if order is not None:
+            table = _in_order(table, dims, order)
+    else:
+        table = _fold(partials).to_frame().T
+    for metric in METRICS:
+        table[(metric, "mean")] = table[(metric, "sum")] / table[(metric, "count")]
+    return table.reindex(columns=_COLUMNS)
+
+
+def _in_order(table, dims, order):
+    ranks = [table.index.get_level_values(dim).map({v: i for i, v in enumerate(order[dim])})
+             for dim in dims]
+    return table.iloc[np.lexsort([np.asarray(r, dtype=float) for r in reversed(ranks)])]
+
+
+def _key(dims):
+    unknown = set(dims) - set(DIMENSIONS)
+    if unknown:
+        raise KeyError(f"not a cube dimension: {sorted(unknown)}")
+    return tuple(d for d in DIMENSIONS if d in dims)
@@ -0,0 +1,166 @@
+"""Process-wide cache of parsed and normalized cancer datasets.
+
+Every Streamlit session shares the same cached frame, so a widget click never
+goes back to disk. Entries are keyed by absolute path and mtime, so an edited
+CSV is parsed again on its next request.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from datasets import COLUMN_RENAMES
+from manifest import dataset_path, get_manifest
+from profiling import span
+from schema import compact
+from store import get_store
+from streaming import load_streamed, sample_frame
+
+MAX_ENTRIES = int(os.environ.get("CANCER_CACHE_MAX_ENTRIES", 32))
+MAX_BYTES = int(os.environ.get("CANCER_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+_cache = OrderedDict()  # (path, mtime_ns) -> (frame, nbytes)
+_cache_bytes = 0
+_lock = threading.Lock()
+
+
+def configure_cache(max_entries=None, max_bytes=None):
+    """Change the eviction bounds; existing entries are trimmed to fit."""
+    global MAX_ENTRIES, MAX_BYTES
+    with _lock:
+        if max_entries is not None:
+            MAX_ENTRIES = max_entries
+        if max_bytes is not None:
+            MAX_BYTES = max_bytes
+        _evict()
+
+
+def normalize(df):
+    """Apply the canonical column names and the compact schema of schema.py."""
+    return compact(df.rename(columns=COLUMN_RENAMES))
+
+
+def load_dataset(path):
+    """Return the normalized frame for ``path``, parsing it at most once per mtime.
+
+    Callers get a shallow copy of the cached frame: they may add, replace or
+    drop columns. Its arrays are read-only, so writing into the values of an
+    existing column raises (or, under copy-on-write, copies) instead of
+    changing the frame every other session shares.
+    """
+    path = os.path.abspath(path)
+    key = (path, os.stat(path).st_mtime_ns)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            _cache.move_to_end(key)
+            return entry[0].copy(deep=False)
+
+    # Parse outside the lock so a slow file does not block other datasets.
+    with span("read_csv"):
+        df = pd.read_csv(path)
+    with span("transform"):
+        df = read_only(normalize(df))
+    nbytes = int(df.memory_usage(deep=True).sum())
+
+    global _cache_bytes
+    with _lock:
+        for stale in [k for k in _cache if k[0] == path and k != key]:
+            _cache_bytes -= _cache.pop(stale)[1]
+        if key not in _cache:
+            _cache[key] = (df, nbytes)
+            _cache_bytes += nbytes
+        _cache.move_to_end(key)
+        _evict()
+        return _cache[key][0].copy(deep=False)
+
+
+def read_only(df):
+    """``df`` rebuilt over read-only copies of its column arrays, like a store slice."""
+    columns = {}
+    for column in df.columns:
+        values = df[column].array
+        if isinstance(values, pd.Categorical):
+            codes = values.codes.copy()
+            codes.flags.writeable = False
+            columns[column] = pd.Categorical.from_codes(codes, dtype=values.dtype)
+        else:
+            array = df[column].to_numpy(copy=True)
+            array.flags.writeable = False
+            columns[column] = array
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def load_cancer(cancer_type):
+    """Return one cancer's frame.
+
+    A completed streaming ingest wins (its bounded sample is returned), then the
+    consolidated store if it holds the file's current content, then the CSV
+    itself.
+    """
+    streamed = load_streamed(cancer_type)
+    if streamed is not None:
+        return sample_frame(streamed)
+    store = current_store(cancer_type)
+    if store is not None:
+        return store.cancer(cancer_type)
+    return load_dataset(dataset_path(cancer_type))
+
+
+def dataset_version(cancer_type):
+    """Identify the current contents of one cancer's data, for cache keys."""
+    streamed = load_streamed(cancer_type)
+    if streamed is not None:
+        return "stream:%d:%d" % (streamed["source"]["mtime_ns"], streamed["rows"])
+    store = current_store(cancer_type)
+    if store is not None:
+        return "store:" + store.meta["sources"][cancer_type]["sha256"]
+    return "csv:%d" % os.stat(dataset_path(cancer_type)).st_mtime_ns
+
+
+def current_store(cancer_type):
+    """The store if it holds ``cancer_type`` as the manifest fingerprints its file, else None.
+
+    The store can lag behind a changed file, e.g. with CANCER_SHARED_STORE=0
+    until ``python ingest.py`` runs again; the CSV is served meanwhile.
+    """
+    store = get_store()
+    if store is None or cancer_type not in store.offsets:
+        return None
+    sha256 = store.meta["sources"].get(cancer_type, {}).get("sha256")
+    return store if sha256 == get_manifest().datasets[cancer_type].sha256 else None
+
+
+def load_partials(cancer_type):
+    """Exact cube partials from a streaming ingest, or None to aggregate the frame."""
+    streamed = load_streamed(cancer_type)
+    return streamed["partials"] if streamed is not None else None
+
+
+def invalidate(path=None):
+    """Drop the cached entries for ``path``, or everything when no path is given."""
+    global _cache_bytes
+    with _lock:
+        if path is None:
+            _cache.clear()
+            _cache_bytes = 0
+            return
+        path = os.path.abspath(path)
+        for key in [k for k in _cache if k[0] == path]:
+            _cache_bytes -= _cache.pop(key)[1]
+
+
+def cache_info():
+    with _lock:
+        return {"entries": len(_cache), "bytes": _cache_bytes,
+                "max_entries": MAX_ENTRIES, "max_bytes": MAX_BYTES}
+
+
+def _evict():
+    global _cache_bytes
+    # Always keep the most recent entry, even if it alone exceeds MAX_BYTES.
+    while len(_cache) > 1 and (len(_cache) > MAX_ENTRIES or _cache_bytes > MAX_BYTES):
+        _, (_, nbytes) = _cache.popitem(last=False)
+        _cache_bytes -= nbytes
@@ -0,0 +1,34 @@
+"""Dataset catalogue shared by the dashboard and the offline tools."""
+
+import os
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CANCER_FILES = {
+    "Esophageal Cancer": "2esophageal cancer.csv",
+    "Pancreatic Cancer": "1pancreatic_cancer_dataset.csv",
+    "Liver Cancer": "3liver_cancer.csv",
+    "Lung Cancer": "4lung_cancer.csv",
+    "Ovarian Cancer": "5ovarian cancer.csv",
+    "Myeloma Cancer": "8Myeloma Cancer.csv",
+    "Stomache Cancer": "6stomache cancer.csv",
+    "Laryngeal Cancer": "9Laryngeal Cancer.csv",
+    "Brain Cancer": "7brain cancer.csv",
+    "Acute myeloid leukemia": "10acute_myeloid_leukemia.csv",
+    "Bone Cancer": "bone_cancer_data.csv",
+    "Breast Cancer": "breast_cancer_data.csv",
+    "Skin Cancer": "skin_cancer_data.csv",
+    "Retinoblastoma Cancer": "retinoblastoma_data.csv",
+}
+
+# Header variants found in the source CSVs -> canonical column names.
+COLUMN_RENAMES = {
+    "Survival_R": "Survival_Rate",
+    "Death_Rat": "Death_Rate",
+    "Cure%": "%Cure",
+    "Cure_Rate": "%Cure",
+}
+
+DIMENSIONS = ("Age_Group", "Gender", "Stage_of_Cancer")
+METRICS = ("%Cure", "Survival_Rate", "Death_Rate")
+REQUIRED_COLUMNS = DIMENSIONS + METRICS
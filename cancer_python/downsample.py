@@ -0,0 +1,164 @@
+"""Large-dataset mode: bounded-size figures computed server-side.
+
+Above ``ROW_THRESHOLD`` rows a chart no longer receives the raw rows:
+
+* histograms are pre-binned with NumPy and drawn as bars,
+* violins and boxes become precomputed quantile boxes,
+* scatter plots receive a stratified sample of at most ``MAX_POINTS`` rows,
+* density heatmaps receive per-cell sums,
+* line, area, funnel and polar charts plot a cube rollup.
+
+Every such figure gets a title suffix saying how it was reduced.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from datasets import DIMENSIONS
+
+ROW_THRESHOLD = int(os.environ.get("CANCER_LARGE_ROWS", 50_000))
+MAX_POINTS = int(os.environ.get("CANCER_MAX_POINTS", 5_000))
+DEFAULT_BINS = 50
+SEED = 0
+
+# Aggregate used when a chart of this kind is drawn from the cube.
+ROLLUP_KINDS = {"line": "mean", "area": "mean", "funnel": "mean",
+                "line_polar": "mean", "bar_polar": "sum", "bar": "sum",
+                "pie": "sum", "treemap": "sum", "sunburst": "sum", "funnel_area": "sum"}
+
+
+def total_rows(df):
+    """Rows the frame stands for; a streamed sample records its source's count."""
+    return df.attrs.get("total_rows", len(df))
+
+
+def is_large(df):
+    return total_rows(df) > ROW_THRESHOLD
+
+
+def build_large_figure(spec, df, cube):
+    """Bounded-size equivalent of ``px.<spec.kind>(df, **spec.args)``."""
+    args = dict(spec.args)
+    if spec.kind == "histogram":
+        fig, label = binned_histogram(df, args), "pre-binned"
+    elif spec.kind in ("violin", "box"):
+        fig, label = quantile_boxes(df, args), "quantile summary"
+    elif spec.kind in ("scatter", "scatter_3d"):
+        strata = [args[k] for k in ("color", "symbol") if args.get(k) in DIMENSIONS]
+        sample = stratified_sample(df, strata, MAX_POINTS)
+        fig = getattr(px, spec.kind)(sample, **args)
+        label = f"sampled {len(sample):,} of {total_rows(df):,} rows"
+    elif spec.kind == "density_heatmap":
+        fig, label = binned_heatmap(df, args), "pre-binned"
+    elif spec.kind in ROLLUP_KINDS:
+        agg = ROLLUP_KINDS[spec.kind]
+        frame = cube.table(_dimensions(args, spec.melt), agg)
+        if spec.melt:
+            frame = frame.melt(**spec.melt)
+        fig, label = getattr(px, spec.kind)(frame, **args), f"{agg} per group"
+    else:
+        raise ValueError(f"no large-dataset mode for chart kind {spec.kind!r}")
+    if len(df) < total_rows(df) and spec.kind not in ROLLUP_KINDS and "sampled" not in label:
+        label += f" of a {len(df):,}-row sample"
+    return label_figure(fig, args.get("title", ""), label, total_rows(df))
+
+
+def label_figure(fig, title, label, rows):
+    fig.update_layout(title_text=f"{title} ({label}, {rows:,} rows)".strip())
+    return fig
+
+
+def stratified_sample(df, strata, n, seed=SEED):
+    """At most about ``n`` rows, keeping each stratum's share of the data."""
+    if len(df) <= n:
+        return df
+    if not strata:
+        return df.sample(n=n, random_state=seed)
+    frac = n / len(df)
+    return (df.groupby(strata, observed=True, group_keys=False)
+            .sample(frac=frac, random_state=seed))
+
+
+def binned_histogram(df, args):
+    x, color = args["x"], args.get("color")
+    values = df[x].to_numpy(dtype=np.float64)
+    edges = np.histogram_bin_edges(values[~np.isnan(values)], bins=args.get("nbins") or DEFAULT_BINS)
+    centers = (edges[:-1] + edges[1:]) / 2
+
+    parts = []
+    groups = df.groupby(color, observed=True)[x] if color else [(None, df[x])]
+    for name, series in groups:
+        counts, _ = np.histogram(series.to_numpy(dtype=np.float64), bins=edges)
+        part = pd.DataFrame({x: centers, "count": counts})
+        if color:
+            part[color] = name
+        parts.append(part)
+    frame = pd.concat(parts, ignore_index=True)
+
+    barmode = args.get("barmode", "relative")
+    fig = px.bar(frame, x=x, y="count", color=color, barmode=barmode,
+                 opacity=0.6 if barmode == "overlay" else None)
+    fig.update_layout(bargap=0)
+    return fig
+
+
+def quantile_boxes(df, args):
+    x, y, color = args.get("x"), args["y"], args.get("color")
+    keys = list(dict.fromkeys(k for k in (color, x) if k))
+    grouped = (df.groupby(keys, observed=True)[y] if keys
+               else df[y].groupby(np.zeros(len(df), dtype=np.int8)))
+    stats = grouped.quantile([0, 0.25, 0.5, 0.75, 1]).unstack()
+    stats["mean"] = grouped.mean()
+    iqr = stats[0.75] - stats[0.25]
+    stats["lower"] = np.maximum(stats[0], stats[0.25] - 1.5 * iqr)
+    stats["upper"] = np.minimum(stats[1], stats[0.75] + 1.5 * iqr)
+    stats = stats.reset_index()
+
+    fig = go.Figure()
+    for name, part in (stats.groupby(color, observed=True) if color else [(y, stats)]):
+        fig.add_trace(go.Box(
+            name=str(name), x=part[x].astype(str) if x else None,
+            q1=part[0.25], median=part[0.5], q3=part[0.75], mean=part["mean"],
+            lowerfence=part["lower"], upperfence=part["upper"]))
+    fig.update_layout(boxmode="group", xaxis_title=x, yaxis_title=y, legend_title_text=color)
+    return fig
+
+
+def binned_heatmap(df, args):
+    x, y, z = args["x"], args["y"], args.get("z")
+    nbinsx, nbinsy = args.get("nbinsx") or DEFAULT_BINS, args.get("nbinsy") or DEFAULT_BINS
+    cells = pd.DataFrame({x: _bin(df[x], nbinsx), y: _bin(df[y], nbinsy)})
+    if z:
+        cells[z] = df[z].to_numpy()
+        frame = cells.groupby([x, y], observed=True)[z].sum().reset_index()
+    else:
+        frame = cells.groupby([x, y], observed=True).size().rename("count").reset_index()
+        args = dict(args, z="count")
+    return px.density_heatmap(frame, **dict(args, histfunc="sum", nbinsx=nbinsx, nbinsy=nbinsy))
+
+
+def _bin(series, nbins):
+    """Numeric series -> bin centers; categorical series are returned as-is."""
+    if not pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy()
+    values = series.to_numpy(dtype=np.float64)
+    edges = np.histogram_bin_edges(values[~np.isnan(values)], bins=nbins)
+    index = np.clip(np.digitize(values, edges[1:-1]), 0, len(edges) - 2)
+    return ((edges[:-1] + edges[1:]) / 2)[index]
+
+
+def _dimensions(args, melt):
+    """Dimensions a chart groups by, i.e. the cube rollup that can stand in for its rows."""
+    used = []
+    for key in ("x", "y", "color", "names", "theta", "symbol", "path"):
+        value = args.get(key)
+        for column in (value if isinstance(value, list) else [value]):
+            if column in DIMENSIONS and column not in used:
+                used.append(column)
+    if melt:
+        used += [c for c in melt.get("id_vars", []) if c in DIMENSIONS and c not in used]
+    return tuple(used)
@@ -0,0 +1,177 @@
+"""Headless export of every cancer page to static HTML and JSON bundles.
+
+Usage: python export.py [--out DIR] [--jobs N] [--png] [--force] [CANCER ...]
+
+Each cancer is rendered in its own worker process from the same registry,
+figure builders and knowledge fragments as the dashboard. A cancer whose input
+hash (data fingerprint, page definition and knowledge text) matches the last
+export is skipped.
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
+
+from content import FRAGMENTS, KNOWLEDGE
+from data_loader import dataset_version, load_cancer
+from datasets import CANCER_FILES, DATA_DIR
+from figures import page_figure
+from manifest import ManifestError, get_manifest
+from registry import REGISTRY
+from serialize import figure_json, loads
+
+EXPORT_DIR = os.path.join(DATA_DIR, "export")
+# Bump when the bundle layout changes, so every cancer is exported again.
+EXPORT_FORMAT = 2
+# The plotly.js release the installed plotly.py writes its figure JSON for.
+PLOTLY_JS = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+PAGE_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{plotly_js}"></script>
+</head>
+<body style="max-width:960px; margin:auto; font-family:sans-serif;">
+<h2>{title}</h2>
+<pre style="white-space:pre-wrap;">{description}</pre>
+{figures}
+{knowledge}
+</body>
+</html>
+"""
+
+
+def slug(cancer_type):
+    return "".join(c if c.isalnum() else "_" for c in cancer_type.lower())
+
+
+def input_hash(cancer_type):
+    """Fingerprint of everything an export of ``cancer_type`` depends on."""
+    version = dataset_version(cancer_type)
+    inputs = {
+        "format": EXPORT_FORMAT,
+        "data": get_manifest().datasets[cancer_type].sha256,
+        # CSV versions are mtimes, already covered by the content hash above.
+        "source": None if version.startswith("csv:") else version,
+        "page": repr(REGISTRY[cancer_type]),
+        "knowledge": KNOWLEDGE[cancer_type],
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+def build_bundle(cancer_type):
+    """The page and its figures, built exactly as the dashboard builds them."""
+    page = REGISTRY[cancer_type]
+    df = load_cancer(cancer_type)
+    version = dataset_version(cancer_type)
+    figures = [page_figure(page, spec, df, version) for spec in page.charts]
+    return page, figures
+
+
+def export_cancer(cancer_type, out_dir, digest, png=False):
+    """Write ``<out_dir>/<slug>/`` for one cancer; runs in a worker process."""
+    started = time.perf_counter()
+    page, figures = build_bundle(cancer_type)
+    target = os.path.join(out_dir, slug(cancer_type))
+    os.makedirs(target, exist_ok=True)
+
+    bundle = {
+        "name": page.name,
+        "description": page.description,
+        "figures": [loads(figure_json(fig)) for fig in figures],
+        "knowledge": KNOWLEDGE[cancer_type],
+        "input_hash": digest,
+    }
+    with open(os.path.join(target, "bundle.json"), "w", encoding="utf-8") as f:
+        json.dump(bundle, f, ensure_ascii=False)
+
+    divs = "\n".join(pio.to_html(fig, full_html=False, include_plotlyjs=False, validate=False)
+                     for fig in figures)
+    document = PAGE_HTML.format(plotly_js=PLOTLY_JS, title=html.escape(page.name),
+                                description=html.escape(page.description),
+                                figures=divs, knowledge=FRAGMENTS[cancer_type])
+    with open(os.path.join(target, "index.html"), "w", encoding="utf-8") as f:
+        f.write(document)
+
+    if png:
+        for spec, fig in zip(page.charts, figures):
+            fig.write_image(os.path.join(target, f"{spec.chart_id}.png"))
+
+    with open(os.path.join(target, "input_hash"), "w") as f:
+        f.write(digest)
+    return cancer_type, time.perf_counter() - started
+
+
+def previous_hash(out_dir, cancer_type):
+    try:
+        with open(os.path.join(out_dir, slug(cancer_type), "input_hash")) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def export_all(cancer_types, out_dir=EXPORT_DIR, jobs=None, png=False, force=False):
+    """Export the changed cancers in parallel; returns (exported, skipped) names."""
+    pending, skipped = {}, []
+    for cancer_type in cancer_types:
+        digest = input_hash(cancer_type)
+        if not force and previous_hash(out_dir, cancer_type) == digest:
+            skipped.append(cancer_type)
+        else:
+            pending[cancer_type] = digest
+
+    exported = []
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(export_cancer, c, out_dir, d, png) for c, d in pending.items()]
+            for future in as_completed(futures):
+                cancer_type, seconds = future.result()
+                exported.append(cancer_type)
+                print(f"{cancer_type}: exported in {seconds:.2f}s")
+
+    index = {c: slug(c) + "/index.html" for c in CANCER_FILES
+             if os.path.exists(os.path.join(out_dir, slug(c), "index.html"))}
+    with open(os.path.join(out_dir, "index.json"), "w") as f:
+        json.dump(index, f, indent=2)
+    return exported, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=EXPORT_DIR, help="output directory")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPUs)")
+    parser.add_argument("--png", action="store_true", help="also write PNGs (needs kaleido)")
+    parser.add_argument("--force", action="store_true", help="export unchanged cancers too")
+    parser.add_argument("cancers", nargs="*", metavar="CANCER", help="default: all")
+    args = parser.parse_args(argv)
+
+    unknown = [c for c in args.cancers if c not in CANCER_FILES]
+    if unknown:
+        parser.error(f"unknown cancer types: {unknown}")
+    try:
+        get_manifest()
+    except ManifestError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    os.makedirs(args.out, exist_ok=True)
+    started = time.perf_counter()
+    exported, skipped = export_all(args.cancers or list(CANCER_FILES), args.out,
+                                   args.jobs, args.png, args.force)
+    print(f"{len(exported)} exported, {len(skipped)} unchanged "
+          f"in {time.perf_counter() - started:.2f}s -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
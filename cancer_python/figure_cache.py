@@ -0,0 +1,76 @@
+"""LRU cache of serialized Plotly figures.
+
+Figures are keyed by ``(cancer_type, chart_id, data_version)``. A hit turns the
+stored JSON back into a figure without running Plotly Express or property
+validation again; a new data version simply misses and rebuilds. Encoding and decoding go
+through serialize.py, which uses orjson when it is installed.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+
+from profiling import span
+from serialize import figure_json, loads
+
+MAX_ENTRIES = int(os.environ.get("CANCER_FIGURE_CACHE_MAX_ENTRIES", 256))
+MAX_BYTES = int(os.environ.get("CANCER_FIGURE_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+
+class FigureCache:
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> JSON text
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+            return text
+
+    def put(self, key, text):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = text
+            self._bytes += len(text)
+            while len(self._entries) > 1 and (
+                    len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def invalidate(self, cancer_type=None):
+        """Drop every figure of ``cancer_type``, or all figures when it is None."""
+        with self._lock:
+            for key in [k for k in self._entries if cancer_type in (None, k[0])]:
+                self._bytes -= len(self._entries.pop(key))
+
+    def info(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes,
+                    "max_entries": self.max_entries, "max_bytes": self.max_bytes}
+
+
+figure_cache = FigureCache()
+
+
+def cached_figure(cancer_type, chart_id, data_version, build):
+    """Return the figure for the key, calling ``build()`` only on a cache miss."""
+    key = (cancer_type, chart_id, data_version)
+    text = figure_cache.get(key)
+    if text is None:
+        fig = build()
+        with span("serialize"):
+            figure_cache.put(key, figure_json(fig))
+        return fig
+    # The JSON came from a validated figure, so skip validating it again.
+    with span("deserialize"):
+        return go.Figure(loads(text), _validate=False)
@@ -0,0 +1,75 @@
+"""Figure construction for registry pages, independent of Streamlit.
+
+The dashboard, the batch exporter and the static site builder all build their
+figures through ``page_figure``. The dashboard builds a page's charts
+concurrently on a shared thread pool through ``submit_figures``.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import plotly.express as px
+
+from cube import get_cube, selection_cube
+from data_loader import load_partials
+from downsample import build_large_figure, is_large, label_figure, total_rows
+from figure_cache import cached_figure
+from profiling import capture, recording, span
+
+FIGURE_WORKERS = int(os.environ.get("CANCER_FIGURE_WORKERS", min(4, os.cpu_count() or 1)))
+
+_pool = ThreadPoolExecutor(max_workers=FIGURE_WORKERS, thread_name_prefix="figure")
+
+
+def build_figure(spec, df, cube=None):
+    """Run the Plotly Express call described by ``spec`` on ``df``.
+
+    Specs with a ``rollup`` plot the matching table of ``cube`` instead, and
+    frames above the large-dataset threshold get a bounded-size figure. Either
+    way the title says how the rows were reduced.
+    """
+    if spec.rollup:
+        fig = getattr(px, spec.kind)(cube.table(spec.rollup, spec.agg), **spec.args)
+        return label_figure(fig, spec.args.get("title", ""), f"{spec.agg} per group",
+                            total_rows(df))
+    if is_large(df):
+        return build_large_figure(spec, df, cube)
+    if spec.melt:
+        frame = df.melt(**spec.melt)
+    else:
+        frame = df
+    return getattr(px, spec.kind)(frame, **spec.args)
+
+
+def page_figure(page, spec, df, data_version, selection=None):
+    """The cached figure of one chart of ``page``.
+
+    ``df`` is already filtered by ``selection``, if any; the figure is cached
+    per selection. A selection gets a ``selection_cube`` rather than a cube
+    of its own, so a filter change aggregates no more than its charts need.
+    """
+    version = f"{data_version}|{selection.key}" if selection else data_version
+
+    def build():
+        cube = None
+        if spec.rollup or is_large(df):
+            if selection:
+                cube = selection_cube(page.name, df, data_version, selection)
+            else:
+                cube = get_cube(page.name, df, data_version, load_partials(page.name))
+        with span("figure_build"):
+            return build_figure(spec, df, cube)
+    return cached_figure(page.name, spec.chart_id, version, build)
+
+
+def submit_figures(page, df, data_version, selection=None):
+    """Start building every chart of ``page``; returns one future per chart, in order."""
+    spans = capture()
+    return [_pool.submit(_labelled_figure, page, spec, df, data_version, selection, spans)
+            for spec in page.charts]
+
+
+def _labelled_figure(page, spec, df, data_version, selection, spans):
+    # Pool threads have no rerun of their own; report to the rerun that asked.
+    with recording(spans, page.name):
+        return page_figure(page, spec, df, data_version, selection)
@@ -0,0 +1,117 @@
+"""Row filters on the dimensions and metric ranges, answered from a prebuilt index.
+
+``FilterIndex`` keeps, per dimension, one packed bitmap per category and, per
+metric, the row order that sorts it. A selection of categories ORs their
+bitmaps, a metric range is two binary searches into the sort order, and the
+result is the AND of those bitmaps. No filter change ever scans or compares
+the frame's values. The index is built once per cancer and data version.
+"""
+
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from datasets import DIMENSIONS, METRICS
+
+_indexes = {}  # cancer_type -> (data_version, FilterIndex)
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Selection:
+    """Categories kept per dimension and ``(low, high)`` bounds per metric."""
+
+    categories: tuple = ()  # ((dimension, (value, ...)), ...)
+    ranges: tuple = ()  # ((metric, low, high), ...)
+
+    def __bool__(self):
+        return bool(self.categories or self.ranges)
+
+    @property
+    def key(self):
+        """A stable string identifying the selection, for cache keys."""
+        return repr((self.categories, self.ranges))
+
+
+class FilterIndex:
+
+    def __init__(self, df):
+        self.rows = len(df)
+        self.categories = {}  # dimension -> [category, ...]
+        self._bitmaps = {}  # dimension -> {category: packed bitmap}
+        for dim in DIMENSIONS:
+            values = df[dim].astype("category").cat
+            codes = values.codes.to_numpy()
+            # Store slices keep categories that only other cancers use.
+            present = np.bincount(codes[codes >= 0], minlength=len(values.categories)) > 0
+            self.categories[dim] = [str(c) for i, c in enumerate(values.categories) if present[i]]
+            self._bitmaps[dim] = {str(c): np.packbits(codes == i)
+                                  for i, c in enumerate(values.categories) if present[i]}
+        self._values = {m: df[m].to_numpy() for m in METRICS}
+        order_dtype = np.int32 if self.rows < 2**31 else np.int64
+        self._order = {m: np.argsort(v, kind="stable").astype(order_dtype)
+                       for m, v in self._values.items()}
+
+    def bounds(self, metric):
+        """Smallest and largest value of ``metric``."""
+        order = self._order[metric]
+        if not len(order):
+            return 0.0, 0.0
+        values = self._values[metric]
+        # str() gives the shortest repr of a float32, i.e. 45.67 rather than 45.669998...
+        return float(str(values[order[0]])), float(str(values[order[-1]]))
+
+    def mask(self, selection):
+        """Packed bitmap of the rows matching ``selection``."""
+        mask = np.packbits(np.ones(self.rows, dtype=bool))
+        empty = np.zeros_like(mask)
+        for dim, kept in selection.categories:
+            bitmaps = self._bitmaps[dim]
+            union = empty.copy()
+            for category in kept:
+                union |= bitmaps.get(category, empty)
+            mask &= union
+        for metric, low, high in selection.ranges:
+            values, order = self._values[metric], self._order[metric]
+            # Compare in the column's own precision, so a bound of 45.67 keeps float32 45.67.
+            low, high = np.array([low, high], dtype=values.dtype)
+            start = np.searchsorted(values, low, side="left", sorter=order)
+            stop = np.searchsorted(values, high, side="right", sorter=order)
+            if start == 0 and stop == self.rows:
+                continue
+            hits = np.zeros(self.rows, dtype=bool)
+            hits[order[start:stop]] = True
+            mask &= np.packbits(hits)
+        return mask
+
+    def positions(self, selection):
+        """Row positions matching ``selection``, in frame order."""
+        return np.flatnonzero(np.unpackbits(self.mask(selection), count=self.rows))
+
+    def apply(self, df, selection):
+        """The rows of ``df`` (the frame this index was built from) matching ``selection``."""
+        rows = df.take(self.positions(selection)).reset_index(drop=True)
+        for column in rows.select_dtypes("category"):
+            rows[column] = rows[column].cat.remove_unused_categories()
+        return rows
+
+
+def get_index(cancer_type, df, data_version):
+    """Return the filter index of ``cancer_type``, building it once per data version."""
+    with _lock:
+        entry = _indexes.get(cancer_type)
+        if entry is not None and entry[0] == data_version:
+            return entry[1]
+    index = FilterIndex(df)
+    with _lock:
+        _indexes[cancer_type] = (data_version, index)
+    return index
+
+
+def invalidate(cancer_type=None):
+    with _lock:
+        if cancer_type is None:
+            _indexes.clear()
+        else:
+            _indexes.pop(cancer_type, None)
@@ -0,0 +1,125 @@
+"""Validate every dataset in CANCER_FILES and build the consolidated store.
+
+Usage: python ingest.py [--out DIR]
+       python ingest.py --stream [--chunksize ROWS] [--sample-rows ROWS] [CANCER ...]
+       python ingest.py --memory
+
+--stream folds each file chunk by chunk into cancer_aggregates/ instead, for
+sources too large to load at once; rerunning it resumes interrupted files.
+--memory prints each dataset's size as parsed by pandas and in the compact
+schema of schema.py (categorical dimensions, float32 metrics).
+"""
+
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+from data_loader import normalize
+from datasets import CANCER_FILES, DIMENSIONS, METRICS, REQUIRED_COLUMNS
+from manifest import ManifestError, fresh_datasets, get_manifest
+from schema import memory_report
+from store import STORE_DIR, load_store, write_store
+from streaming import CHUNK_ROWS, SAMPLE_ROWS, stream_ingest
+
+
+class SchemaError(ValueError):
+    pass
+
+
+def validate(df, cancer_type):
+    """Raise SchemaError if ``df`` does not match the shared dataset schema."""
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise SchemaError(f"{cancer_type}: missing columns {missing}")
+    for column in DIMENSIONS:
+        if df[column].isna().any():
+            raise SchemaError(f"{cancer_type}: empty values in {column}")
+    for column in METRICS:
+        if not pd.api.types.is_numeric_dtype(df[column]):
+            raise SchemaError(f"{cancer_type}: {column} is not numeric")
+        if df[column].isna().any():
+            raise SchemaError(f"{cancer_type}: empty values in {column}")
+
+
+def ingest(out=STORE_DIR, verbose=True):
+    frames, sources = {}, {}
+    entries = fresh_datasets()
+    for cancer_type in CANCER_FILES:
+        entry = entries[cancer_type]
+        df = normalize(pd.read_csv(entry.path))
+        validate(df, cancer_type)
+        frames[cancer_type] = df
+        sources[cancer_type] = source(entry)
+        if verbose:
+            print(f"{cancer_type}: {len(df)} rows")
+    write_store(frames, out, sources)
+    if verbose:
+        print(f"wrote {out}")
+
+
+def reingest(cancer_type, df, entry, out=STORE_DIR):
+    """Replace one cancer in the store with ``df``, reusing every other cancer's rows."""
+    store = load_store(out)
+    if store is None:
+        return None
+    frames = {name: df if name == cancer_type else store.cancer(name) for name in CANCER_FILES}
+    sources = {**store.meta["sources"], cancer_type: source(entry)}
+    return write_store(frames, out, sources)
+
+
+def memory_usage():
+    """``{cancer_type: memory_report}`` comparing each raw CSV frame with its compact form."""
+    manifest = get_manifest()
+    report = {}
+    for cancer_type in CANCER_FILES:
+        raw = pd.read_csv(manifest.datasets[cancer_type].path)
+        report[cancer_type] = memory_report(raw, normalize(raw))
+    return report
+
+
+def source(entry):
+    """Store metadata recording which file a cancer's rows came from."""
+    return {
+        "file": os.path.basename(entry.path),
+        "mtime_ns": entry.mtime_ns,
+        "sha256": entry.sha256,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=STORE_DIR, help="store directory")
+    parser.add_argument("--stream", action="store_true",
+                        help="chunked, resumable aggregation instead of the store")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_ROWS, help="rows per chunk")
+    parser.add_argument("--sample-rows", type=int, default=SAMPLE_ROWS,
+                        help="rows kept for row-level charts")
+    parser.add_argument("--memory", action="store_true",
+                        help="report memory per dataset before and after compaction")
+    parser.add_argument("cancers", nargs="*", metavar="CANCER",
+                        help="cancer types to stream (default: all)")
+    args = parser.parse_args(argv)
+    try:
+        if args.memory:
+            print(f"{'dataset':22s} {'rows':>10s} {'raw bytes':>12s} {'compact':>12s}  ratio")
+            for cancer_type, usage in memory_usage().items():
+                print(f"{cancer_type:22s} {usage['rows']:>10,} {usage['raw_bytes']:>12,}"
+                      f" {usage['compact_bytes']:>12,}  {usage['ratio']:.1f}x")
+        elif args.stream:
+            unknown = [c for c in args.cancers if c not in CANCER_FILES]
+            if unknown:
+                parser.error(f"unknown cancer types: {unknown}")
+            for cancer_type in args.cancers or CANCER_FILES:
+                stream_ingest(cancer_type, chunksize=args.chunksize, sample_rows=args.sample_rows)
+        else:
+            ingest(args.out)
+    except (OSError, ValueError, ManifestError) as exc:
+        print(f"ingest failed: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
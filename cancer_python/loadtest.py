@@ -0,0 +1,179 @@
+"""Drive many concurrent simulated sessions through the dashboard.
+
+Usage: python loadtest.py [--sessions N] [--actions N] [--compare-share P]
+                          [--seed N] [--json FILE]
+
+Every session is a Streamlit AppTest running index.py in a process of its
+own: AppTest is not thread-safe, so two of them cannot share a process. A
+session opens the app, then performs random actions: picking a cancer type
+in the single-cancer view, or switching to the comparison view. Each action
+is one full rerun of the script.
+
+Each process first runs a warm-up session through every cancer and the
+comparison view, so the imports and its caches are in place before its
+memory baseline is taken. The measured sessions then start together. The
+report gives throughput, p50/p95/p99 rerun latency, the growth in process
+memory per session, and the per-span histograms recorded by profiling.py
+during the run. The knowledge sections are HTML <details> elements that
+open in the browser without a rerun, so they cost nothing here.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import profiling
+from datasets import CANCER_FILES, DATA_DIR
+
+APP = os.path.join(DATA_DIR, "index.py")
+TIMEOUT = 120
+
+_start = None  # Barrier the measured sessions start behind, one per worker process
+
+
+def rss_bytes():
+    """Current resident set size of this process."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # Peak rather than current RSS, in KiB on Linux and bytes on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_session(session_id, actions, compare_share, seed, latencies, errors):
+    """Run one session; returns its AppTest so its state stays alive until the report."""
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(f"{seed}:{session_id}")
+    app = AppTest.from_file(APP, default_timeout=TIMEOUT)
+
+    def rerun(action):
+        started = time.perf_counter()
+        action.run()
+        latencies.append(time.perf_counter() - started)
+        if app.exception:
+            errors.append(f"session {session_id}: {app.exception[0].message}")
+
+    rerun(app)
+    view = "Single cancer"
+    for _ in range(actions):
+        if rng.random() < compare_share:
+            view = "Compare cancers" if view == "Single cancer" else "Single cancer"
+            rerun(app.sidebar.radio[0].set_value(view))
+        elif view == "Single cancer":
+            rerun(app.sidebar.selectbox[0].select(rng.choice(list(CANCER_FILES))))
+        else:
+            view = "Single cancer"
+            rerun(app.sidebar.radio[0].set_value(view))
+    return app
+
+
+def warm_up():
+    """Run one session through every view, so it pays the imports and fills the caches."""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP, default_timeout=TIMEOUT)
+    app.run()
+    for cancer_type in CANCER_FILES:
+        app.sidebar.selectbox[0].select(cancer_type).run()
+    app.sidebar.radio[0].set_value("Compare cancers").run()
+    return app
+
+
+def measured_session(session_id, actions, compare_share, seed):
+    """Warm this process up, then run one session; returns what it measured."""
+    warm = warm_up()
+    profiling.reset()
+    rss_before = rss_bytes()
+    _start.wait(timeout=TIMEOUT * (len(CANCER_FILES) + 2))
+    latencies, errors = [], []
+    started = time.time()
+    app = run_session(session_id, actions, compare_share, seed, latencies, errors)
+    finished = time.time()
+    rss_after = rss_bytes()
+    del app, warm
+    return {"latencies": latencies, "errors": errors, "started": started,
+            "finished": finished, "rss_before": rss_before, "rss_after": rss_after,
+            "histograms": profiling.histograms()}
+
+
+def _init_worker(barrier):
+    global _start
+    _start = barrier
+    # Every process warms itself up; a background warm-up would skew the timings.
+    os.environ["CANCER_WARMUP"] = "0"
+    os.environ.pop("CANCER_READY_PORT", None)
+
+
+def load_test(sessions, actions, compare_share=0.1, seed=0):
+    # Fresh interpreters, so each process's memory is its session's alone.
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(sessions)
+    with ProcessPoolExecutor(max_workers=sessions, mp_context=context, max_tasks_per_child=1,
+                             initializer=_init_worker, initargs=(barrier,)) as pool:
+        results = list(pool.map(measured_session, range(sessions), [actions] * sessions,
+                                [compare_share] * sessions, [seed] * sessions))
+
+    latencies = [ms for r in results for ms in r["latencies"]]
+    errors = [e for r in results for e in r["errors"]]
+    elapsed = max(r["finished"] for r in results) - min(r["started"] for r in results)
+    growth = [r["rss_after"] - r["rss_before"] for r in results]
+    profiling.reset()
+    for r in results:
+        profiling.merge(r["histograms"])
+
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    report = {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "errors": errors,
+        "elapsed_s": elapsed,
+        "throughput_rps": len(latencies) / elapsed,
+        "latency_ms": {"p50": cuts[49] * 1000, "p95": cuts[94] * 1000, "p99": cuts[98] * 1000,
+                       "max": max(latencies) * 1000},
+        "rss_bytes": {"before": statistics.mean(r["rss_before"] for r in results),
+                      "per_session": statistics.mean(growth), "max_session": max(growth)},
+        "spans": profiling.snapshot(),
+    }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20,
+                        help="concurrent sessions, one process each")
+    parser.add_argument("--actions", type=int, default=10, help="reruns per session after the first")
+    parser.add_argument("--compare-share", type=float, default=0.1,
+                        help="probability that an action switches view")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="FILE", help="also write the full report as JSON")
+    args = parser.parse_args(argv)
+
+    report = load_test(args.sessions, args.actions, args.compare_share, args.seed)
+    latency, rss = report["latency_ms"], report["rss_bytes"]
+    print(f"{report['sessions']} sessions, {report['reruns']} reruns in {report['elapsed_s']:.1f}s"
+          f" ({report['throughput_rps']:.1f} reruns/s)")
+    print(f"rerun latency ms: p50 {latency['p50']:.0f}  p95 {latency['p95']:.0f}"
+          f"  p99 {latency['p99']:.0f}  max {latency['max']:.0f}")
+    print(f"memory: {rss['per_session'] / 2**20:.1f} MiB per session"
+          f" (max {rss['max_session'] / 2**20:.1f}) over a warm process of"
+          f" {rss['before'] / 2**20:.0f} MiB")
+    for error in report["errors"][:10]:
+        print(error, file=sys.stderr)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
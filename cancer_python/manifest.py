@@ -0,0 +1,181 @@
+"""Startup manifest: every dataset and asset resolved, validated and fingerprinted once.
+
+Paths are resolved against the project directory, so the working directory
+does not matter, and a file whose name differs from the catalogue only in
+case is still found (with a warning). Anything missing or malformed fails the
+whole manifest with a report, before any user request is served.
+
+Usage: python manifest.py   (prints the report; exits non-zero on problems)
+"""
+
+import hashlib
+import os
+import sys
+import threading
+from collections import namedtuple
+
+import pandas as pd
+from PIL import Image
+
+from datasets import CANCER_FILES, COLUMN_RENAMES, DATA_DIR, REQUIRED_COLUMNS
+
+ASSETS = ("cancer1.webp", "cancer.jpg", "eso.webp", "knowledge.json")
+# Files above this size are fingerprinted from their size, head and tail only.
+FULL_HASH_LIMIT = 256 * 1024 * 1024
+
+Entry = namedtuple("Entry", "name path size mtime_ns sha256")
+
+
+class ManifestError(RuntimeError):
+
+    def __init__(self, problems):
+        super().__init__("dataset manifest failed:\n" + "\n".join(f"  - {p}" for p in problems))
+        self.problems = problems
+
+
+class Manifest:
+
+    def __init__(self, datasets, assets, warnings):
+        self.datasets = datasets  # cancer type -> Entry
+        self.assets = assets  # file name -> Entry
+        self.warnings = warnings
+
+    def report(self):
+        lines = [f"{name}: {e.path} ({e.size:,} bytes, sha256 {e.sha256[:12]})"
+                 for name, e in {**self.datasets, **self.assets}.items()]
+        return "\n".join(lines + [f"warning: {w}" for w in self.warnings])
+
+
+_manifest = None
+_lock = threading.Lock()
+
+
+def build_manifest(directory=DATA_DIR):
+    problems, warnings = [], []
+    listing = {name.lower(): name for name in os.listdir(directory)}
+
+    def resolve(label, filename):
+        if os.path.isfile(os.path.join(directory, filename)):
+            return os.path.join(directory, filename)
+        actual = listing.get(filename.lower())
+        if actual is None:
+            problems.append(f"{label}: {filename!r} not found in {directory}")
+            return None
+        warnings.append(f"{label}: {filename!r} resolved to {actual!r}")
+        return os.path.join(directory, actual)
+
+    datasets = {}
+    for cancer_type, filename in CANCER_FILES.items():
+        path = resolve(cancer_type, filename)
+        if path is None:
+            continue
+        try:
+            header = [COLUMN_RENAMES.get(c, c) for c in pd.read_csv(path, nrows=0).columns]
+        except (OSError, ValueError) as exc:
+            problems.append(f"{cancer_type}: unreadable CSV: {exc}")
+            continue
+        missing = [c for c in REQUIRED_COLUMNS if c not in header]
+        if missing:
+            problems.append(f"{cancer_type}: missing columns {missing}")
+            continue
+        datasets[cancer_type] = _entry(cancer_type, path)
+
+    assets = {}
+    for name in ASSETS:
+        path = resolve(name, name)
+        if path is None:
+            continue
+        if not name.endswith(".json"):
+            try:
+                with Image.open(path) as img:
+                    img.verify()
+            except (OSError, SyntaxError) as exc:
+                problems.append(f"{name}: not a readable image: {exc}")
+                continue
+        assets[name] = _entry(name, path)
+
+    if problems:
+        raise ManifestError(problems)
+    return Manifest(datasets, assets, warnings)
+
+
+def get_manifest(refresh=False):
+    """The process-wide manifest, built on first use."""
+    global _manifest
+    with _lock:
+        if _manifest is None or refresh:
+            _manifest = build_manifest()
+        return _manifest
+
+
+def dataset_path(cancer_type):
+    """Absolute, verified path of one cancer's dataset."""
+    return get_manifest().datasets[cancer_type].path
+
+
+def dataset_entry(cancer_type):
+    """A fresh entry for one dataset's file, without touching the manifest."""
+    return _entry(cancer_type, dataset_path(cancer_type))
+
+
+def update_dataset(entry):
+    """Replace one dataset's entry in the process-wide manifest after its file changed."""
+    manifest = get_manifest()
+    with _lock:
+        manifest.datasets[entry.name] = entry
+
+
+def fresh_datasets():
+    """Entries for every dataset as its file is now, updating the manifest to match.
+
+    Another worker may have picked up a changed file before this one did, so
+    its cached entry cannot be trusted. Only files whose size or mtime moved
+    are hashed again.
+    """
+    entries = {}
+    for name, known in list(get_manifest().datasets.items()):
+        stat = os.stat(known.path)
+        if (stat.st_size, stat.st_mtime_ns) == (known.size, known.mtime_ns):
+            entries[name] = known
+        else:
+            entries[name] = _entry(name, known.path)
+            update_dataset(entries[name])
+    return entries
+
+
+def asset_path(name):
+    return get_manifest().assets[name].path
+
+
+def file_sha256(path, size=None):
+    size = os.path.getsize(path) if size is None else size
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        if size <= FULL_HASH_LIMIT:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        else:
+            digest.update(str(size).encode())
+            digest.update(f.read(1 << 20))
+            f.seek(-(1 << 20), os.SEEK_END)
+            digest.update(f.read(1 << 20))
+    return digest.hexdigest()
+
+
+def _entry(name, path):
+    stat = os.stat(path)
+    return Entry(name, path, stat.st_size, stat.st_mtime_ns, file_sha256(path, stat.st_size))
+
+
+def main():
+    try:
+        manifest = build_manifest()
+    except ManifestError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(manifest.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Named timing spans and per-cancer latency histograms for dashboard reruns.
+
+Wrap work in ``with span("load"):``. Every span is recorded in a fixed-bucket
+histogram keyed by (page label, span name); the page label is set once per
+rerun with ``begin_rerun``/``set_label``. ``end_rerun`` records the whole
+rerun as the ``rerun`` span and, when CANCER_PROFILE_LOG names a file,
+appends one JSON line with all span timings of that rerun. Work handed to
+other threads joins the rerun's spans through ``capture`` and ``recording``.
+"""
+
+import bisect
+import json
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bucket bounds in milliseconds; the last bucket catches everything else.
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, math.inf)
+PROFILE_LOG = os.environ.get("CANCER_PROFILE_LOG")
+
+logger = logging.getLogger("cancer.profile")
+
+_histograms = {}  # (label, span) -> Histogram
+_lock = threading.Lock()
+_local = threading.local()
+
+
+class Histogram:
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS_MS)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def merge(self, other):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def observe(self, ms):
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for bound, n in zip(BUCKETS_MS, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def summary(self):
+        return {"count": self.count, "mean_ms": self.total_ms / max(self.count, 1),
+                "p50_ms": self.quantile(0.5), "p95_ms": self.quantile(0.95),
+                "p99_ms": self.quantile(0.99), "max_ms": self.max_ms,
+                "buckets": dict(zip(map(str, BUCKETS_MS), self.counts))}
+
+
+def record(label, name, ms):
+    with _lock:
+        histogram = _histograms.get((label, name))
+        if histogram is None:
+            histogram = _histograms[(label, name)] = Histogram()
+        histogram.observe(ms)
+
+
+@contextmanager
+def span(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - started) * 1000
+        record(getattr(_local, "label", "-"), name, ms)
+        spans = getattr(_local, "spans", None)
+        if spans is not None:
+            spans.append((name, ms))
+
+
+def begin_rerun(label="-"):
+    _local.label = label
+    _local.spans = []
+    _local.started = time.perf_counter()
+
+
+def set_label(label):
+    _local.label = label
+
+
+def capture():
+    """The current rerun's span list, for work this rerun hands to other threads."""
+    return getattr(_local, "spans", None)
+
+
+@contextmanager
+def recording(spans, label):
+    """Label this thread's spans ``label`` and add them to ``spans`` (from ``capture``)."""
+    previous = getattr(_local, "label", "-"), getattr(_local, "spans", None)
+    _local.label, _local.spans = label, spans
+    try:
+        yield
+    finally:
+        _local.label, _local.spans = previous
+
+
+def end_rerun():
+    """Record the rerun total and return this rerun's ``[(span, ms), ...]``."""
+    spans = getattr(_local, "spans", None) or []
+    started = getattr(_local, "started", None)
+    if started is None:
+        return spans
+    total = (time.perf_counter() - started) * 1000
+    spans.append(("rerun", total))
+    record(_local.label, "rerun", total)
+    line = json.dumps({"ts": time.time(), "label": _local.label,
+                       "spans": [{"name": n, "ms": round(ms, 3)} for n, ms in spans]})
+    logger.debug(line)
+    if PROFILE_LOG:
+        with _lock, open(PROFILE_LOG, "a") as f:
+            f.write(line + "\n")
+    # Fragment reruns skip begin_rerun; they only feed the histograms.
+    _local.started = _local.spans = None
+    return spans
+
+
+def snapshot():
+    """``{label: {span: summary}}`` for every histogram recorded so far."""
+    with _lock:
+        result = {}
+        for (label, name), histogram in sorted(_histograms.items()):
+            result.setdefault(label, {})[name] = histogram.summary()
+        return result
+
+
+def histograms():
+    """A copy of every histogram, e.g. to hand back from a worker process."""
+    with _lock:
+        return dict(_histograms)
+
+
+def merge(histograms):
+    """Add ``histograms`` (from ``histograms()`` in another process) to this one's."""
+    with _lock:
+        for key, histogram in histograms.items():
+            _histograms.setdefault(key, Histogram()).merge(histogram)
+
+
+def export_json(path):
+    with open(path, "w") as f:
+        json.dump(snapshot(), f, indent=2)
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
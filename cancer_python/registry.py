@@ -0,0 +1,360 @@
+"""Declarative description of every cancer page shown by the dashboard.
+
+Each ``CancerPage`` lists the description and the two charts of one cancer;
+``render.py`` turns an entry into Streamlit output. The knowledge sections
+live in knowledge.json (see content.py). Adding a cancer is a matter of adding
+a CANCER_FILES entry, a page here and its sections there.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class ChartSpec:
+    """One Plotly Express call: ``px.<kind>(frame, **args)``."""
+
+    chart_id: str
+    kind: str
+    args: dict = field(default_factory=dict)
+    # Optional ``DataFrame.melt`` keyword arguments applied before plotting.
+    melt: dict = None
+    # Plot the cube rollup over these dimensions instead of the raw rows. With
+    # "sum" pies, treemaps and the like get the same slice sizes as from the
+    # raw rows. Bars use "mean", so their labels and hover show a rate, not
+    # the meaningless sum of the rates of every row behind the bar.
+    rollup: tuple = None
+    agg: str = "sum"
+
+
+@dataclass(frozen=True)
+class CancerPage:
+    name: str
+    description: str
+    # Name used in the "All You Need to Know About ..." heading.
+    heading: str
+    # Name used in the expander titles, e.g. "Symptoms of <topic>".
+    topic: str
+    charts: tuple
+
+
+PAGES = (
+    CancerPage(
+        name="Esophageal Cancer",
+        description=(
+            "Esophageal cancer is a type of cancer that starts in the esophagus, "
+            "the long tube that carries food and liquids from your throat to your "
+            "stomach. In this cancer, the cells inside the lining of the "
+            "esophagus grow in an uncontrolled way and form a tumor. This can "
+            "make swallowing food or drinks difficult, cause chest pain, weight "
+            "loss, or a long-lasting cough."
+        ),
+        heading="Esophageal Cancer",
+        topic="Esophageal Cancer",
+        charts=(
+            ChartSpec("fig1", "bar", dict(
+                x="Age_Group", y="Survival_Rate", color="Gender",
+                barmode="group", text_auto=".2f",
+                title="📊 Esophageal Cancer - Survival Rate by Age Group"),
+                rollup=("Age_Group", "Gender"), agg="mean"),
+            ChartSpec("fig2", "line", dict(
+                x="Age_Group", y="Death_Rate", color="Gender", markers=True,
+                title="📈 Esophageal Cancer - Death Rate Trend")),
+        ),
+    ),
+    CancerPage(
+        name="Pancreatic Cancer",
+        description=(
+            "Pancreatic cancer is a type of cancer that starts in the pancreas, "
+            "an organ behind the stomach that helps with digestion (by making "
+            "enzymes) and controls blood sugar (by making insulin).In this "
+            "cancer, cells in the pancreas grow uncontrollably and form a tumor. "
+            "It often spreads quickly and is hard to detect early because "
+            "symptoms usually appear late."
+        ),
+        heading="Pancreatic Cancer",
+        topic="Pancreatic Cancer",
+        charts=(
+            ChartSpec("fig1", "area", dict(
+                x="Age_Group", y="%Cure", color="Gender",
+                title="📈 Pancreatic Cancer - Cure % Trend by Age Group")),
+            ChartSpec("fig2", "bar", dict(
+                x="Stage_of_Cancer", y="Survival_Rate", color="Gender",
+                barmode="group", text_auto=".2f",
+                title="📊 Pancreatic Cancer - Survival Rate by Stage"),
+                rollup=("Stage_of_Cancer", "Gender"), agg="mean"),
+        ),
+    ),
+    CancerPage(
+        name="Liver Cancer",
+        description=(
+            "Liver cancer is a type of cancer that starts in the liver, the large "
+            "organ in your upper right belly that helps clean the blood, digest "
+            "food, and store energy.In this cancer, liver cells begin to grow "
+            "abnormally and uncontrollably, forming a tumor. It can affect the "
+            "liver’s ability to filter toxins, make proteins, and regulate body "
+            "functions."
+        ),
+        heading="Liver Cancer",
+        topic="Liver Cancer",
+        charts=(
+            ChartSpec("fig1", "pie", dict(
+                names="Stage_of_Cancer", values="Death_Rate",
+                title="Liver Cancer - Death Rate Distribution by Stage"),
+                rollup=("Stage_of_Cancer",)),
+            ChartSpec("fig2", "bar", dict(
+                x="Age_Group", y="Survival_Rate", color="Gender",
+                title="Liver Cancer - Survival Rate by Age Group"),
+                rollup=("Age_Group", "Gender"), agg="mean"),
+        ),
+    ),
+    CancerPage(
+        name="Lung Cancer",
+        description=(
+            "Lung cancer is a type of cancer that starts in the lungs, the organs "
+            "that help you breathe and supply oxygen to your body.In this cancer, "
+            "cells in the lungs grow uncontrollably and form a tumor. It can "
+            "block air passages, spread to other parts of the body, and make "
+            "breathing difficult. Smoking is the main cause, but non-smokers can "
+            "also get it"
+        ),
+        heading="Lung Cancer",
+        topic="Lung Cancer",
+        charts=(
+            ChartSpec("fig1", "violin", dict(
+                x="Stage_of_Cancer", y="Survival_Rate", color="Gender",
+                box=True, points="all",
+                title="🌫 Lung Cancer - Survival Rate Distribution by Stage")),
+            ChartSpec("fig2", "histogram", dict(
+                x="Survival_Rate", color="Gender", nbins=10, barmode="overlay",
+                title="Lung Cancer - Survival Rate Histogram")),
+        ),
+    ),
+    CancerPage(
+        name="Ovarian Cancer",
+        description=(
+            "Ovarian cancer is a type of cancer that starts in the ovaries, the "
+            "female reproductive organs that produce eggs and hormones.In this "
+            "cancer, the cells in the ovary grow uncontrollably and form a tumor. "
+            "Since the ovaries are deep in the abdomen, symptoms often appear "
+            "late, making it harder to detect early"
+        ),
+        heading="Ovarian Cancer",
+        topic="Ovarian Cancer",
+        charts=(
+            ChartSpec("fig1", "treemap", dict(
+                path=["Stage_of_Cancer", "Gender"], values="Death_Rate",
+                title="🌸 Ovarian Cancer - Death Rate by Stage & Gender"),
+                rollup=("Stage_of_Cancer", "Gender")),
+            ChartSpec("fig2", "bar", dict(
+                x="Age_Group", y="%Cure", color="Gender",
+                title="Ovarian Cancer - Cure % by Age Group"),
+                rollup=("Age_Group", "Gender"), agg="mean"),
+        ),
+    ),
+    CancerPage(
+        name="Myeloma Cancer",
+        description=(
+            "Myeloma (Multiple Myeloma) is a type of cancer that starts in the "
+            "plasma cells, which are a kind of white blood cell found in the bone "
+            "marrow. Plasma cells normally help fight infections by making "
+            "antibodies.In this cancer, plasma cells grow uncontrollably, "
+            "crowding out healthy blood cells and making abnormal proteins. This "
+            "can damage the bones, kidneys, and immune system."
+        ),
+        heading="Myeloma Cancer",
+        topic="Myeloma Cancer",
+        charts=(
+            ChartSpec("fig1", "funnel", dict(
+                x="Stage_of_Cancer", y="%Cure", color="Stage_of_Cancer",
+                title="📉 Myeloma Cancer - Cure % by Stage")),
+            ChartSpec("fig2", "bar", dict(
+                x="Age_Group", y="Survival_Rate", color="Gender",
+                title="Myeloma Cancer - Survival Rate by Age Group"),
+                rollup=("Age_Group", "Gender"), agg="mean"),
+        ),
+    ),
+    CancerPage(
+        name="Stomache Cancer",
+        description=(
+            "Stomach cancer (Gastric cancer) is a type of cancer that starts in "
+            "the stomach, the organ that helps break down and digest food.In this "
+            "cancer, the cells of the stomach lining grow abnormally and "
+            "uncontrollably, forming a tumor. It can spread to nearby organs and "
+            "often develops slowly over many years"
+        ),
+        heading="Stomach Cancer",
+        topic="Stomach Cancer",
+        charts=(
+            ChartSpec("fig1", "histogram", dict(
+                x="Survival_Rate", color="Gender", nbins=10, barmode="overlay",
+                title="🍽 Stomach Cancer - Survival Rate Distribution")),
+            ChartSpec("fig2", "box", dict(
+                x="Stage_of_Cancer", y="%Cure", color="Gender",
+                title="Stomach Cancer - Cure % by Stage")),
+        ),
+    ),
+    CancerPage(
+        name="Laryngeal Cancer",
+        description=(
+            "Laryngeal cancer is a type of cancer that starts in the larynx "
+            "(voice box), the part of the throat that helps you speak, breathe, "
+            "and swallow.In this cancer, the cells in the lining of the larynx "
+            "grow abnormally and uncontrollably, forming a tumor. Since the "
+            "larynx controls the voice, this cancer often affects speaking and "
+            "breathing. Smoking and heavy alcohol use are the main risk factors."
+        ),
+        heading="Laryngeal Cancer",
+        topic="Laryngeal Cancer",
+        charts=(
+            ChartSpec("fig1", "box", dict(
+                x="Gender", y="Survival_Rate", color="Gender", points="all",
+                title="🎤 Laryngeal Cancer - Survival Rate by Gender")),
+            ChartSpec("fig2", "line", dict(
+                x="Age_Group", y="%Cure", color="Gender", markers=True,
+                title="Laryngeal Cancer - Cure % Trend by Age Group")),
+        ),
+    ),
+    CancerPage(
+        name="Brain Cancer",
+        description=(
+            "Brain cancer is a type of cancer that starts in the brain cells.In "
+            "this cancer, abnormal cells in the brain grow uncontrollably and "
+            "form a tumor. This tumor can press on different parts of the brain, "
+            "affecting memory, movement, balance, vision, and other body "
+            "functions. Brain cancer can spread within the brain and spinal cord "
+            "but usually doesn’t spread to other parts of the body"
+        ),
+        heading="Brain Cancer",
+        topic="Brain Cancer",
+        charts=(
+            ChartSpec("fig1", "scatter", dict(
+                x="Survival_Rate", y="Death_Rate", size="%Cure",
+                color="Gender", hover_name="Stage_of_Cancer",
+                title="🧠 Brain Cancer - Survival vs Death Rate vs Cure %")),
+            ChartSpec("fig2", "bar", dict(
+                x="Age_Group", y="Survival_Rate", color="Gender",
+                title="Brain Cancer - Survival Rate by Age Group"),
+                rollup=("Age_Group", "Gender"), agg="mean"),
+        ),
+    ),
+    CancerPage(
+        name="Acute myeloid leukemia",
+        description=(
+            "Acute Myeloid Leukemia (AML) is a type of blood cancer that starts "
+            "in the bone marrow, where new blood cells are made.In AML, the bone "
+            "marrow makes too many immature white blood cells (called "
+            "myeloblasts) that don’t work properly. These cells crowd out healthy "
+            "blood cells, leading to problems like infections, anemia, and "
+            "bleeding. AML develops quickly (acute) and needs early treatment"
+        ),
+        heading="Acute Myeloid Leukemia Cancer",
+        topic="Acute Myeloid Leukemia",
+        charts=(
+            ChartSpec("fig1", "line", dict(
+                x="Age_Group", y="%Cure", color="Gender", markers=True,
+                title="🩸 Acute Myeloid Leukemia - Cure % Trend by Age Group")),
+            ChartSpec("fig2", "bar", dict(
+                x="Stage_of_Cancer", y="Survival_Rate", color="Gender",
+                barmode="group", text_auto=".2f",
+                title="Acute Myeloid Leukemia - Survival Rate by Stage"),
+                rollup=("Stage_of_Cancer", "Gender"), agg="mean"),
+        ),
+    ),
+    CancerPage(
+        name="Breast Cancer",
+        description=(
+            "Breast cancer is a type of cancer that starts in the breast tissue, "
+            "usually in the milk ducts or milk-producing glands (lobules).In this "
+            "cancer, the breast cells grow abnormally and uncontrollably, forming "
+            "a lump or tumor. It can spread to nearby tissues or other parts of "
+            "the body if not treated early. Breast cancer is one of the most "
+            "common cancers in women, but men can also get it."
+        ),
+        heading="Breast Cancer",
+        topic="Breast Cancer",
+        charts=(
+            ChartSpec("fig1", "pie", dict(
+                names="Gender", values="%Cure", hole=0.4,
+                title="🎀 Breast Cancer - Cure % Distribution by Gender"),
+                rollup=("Gender",)),
+            ChartSpec("fig2", "line_polar", dict(
+                r="Value", theta="Metric", color="Gender", line_close=True,
+                # Above 1000 points px switches to scatterpolargl, whose lines
+                # reject the shape it sets.
+                render_mode="svg",
+                title="Breast Cancer - Survival vs Death Rate Radar"),
+                melt=dict(id_vars=["Gender"], value_vars=["Survival_Rate", "Death_Rate"],
+                          var_name="Metric", value_name="Value")),
+        ),
+    ),
+    CancerPage(
+        name="Skin Cancer",
+        description=(
+            "Skin cancer is a type of cancer that starts in the skin cells.In "
+            "this cancer, the skin cells grow abnormally and uncontrollably, "
+            "usually because of too much exposure to the sun’s ultraviolet (UV) "
+            "rays or tanning beds. It is the most common type of cancer but also "
+            "one of the most preventable. There are different types, such as "
+            "basal cell carcinoma, squamous cell carcinoma, and melanoma."
+        ),
+        heading="Skin Cancer",
+        topic="Skin Cancer",
+        charts=(
+            ChartSpec("fig1", "density_heatmap", dict(
+                x="Age_Group", y="Survival_Rate", z="Death_Rate",
+                color_continuous_scale="Viridis",
+                title="☀ Skin Cancer - Survival vs Death Rate Heatmap")),
+            ChartSpec("fig2", "scatter", dict(
+                x="Stage_of_Cancer", y="%Cure", size="Survival_Rate",
+                color="Gender", hover_name="Age_Group",
+                title="Skin Cancer - Cure % vs Stage (Bubble Chart)")),
+        ),
+    ),
+    CancerPage(
+        name="Bone Cancer",
+        description=(
+            "Bone cancer is a type of cancer that starts in the bones.In this "
+            "cancer, the bone cells grow abnormally and uncontrollably, forming a "
+            "tumor inside the bone. It can weaken the bone, cause pain, swelling, "
+            "and sometimes fractures. Bone cancer may begin in the bone itself "
+            "(primary bone cancer) or spread to the bone from other cancers "
+            "(secondary bone cancer)"
+        ),
+        heading="Bone Cancer",
+        topic="Bone Cancer",
+        charts=(
+            ChartSpec("fig1", "scatter_3d", dict(
+                x="%Cure", y="Survival_Rate", z="Death_Rate",
+                color="Gender", symbol="Stage_of_Cancer",
+                title="🦴 Bone Cancer - 3D Analysis (%Cure, Survival, Death)")),
+            ChartSpec("fig2", "funnel_area", dict(
+                names="Stage_of_Cancer", values="Survival_Rate",
+                title="Bone Cancer - Survival Rate by Stage (Funnel Area)"),
+                rollup=("Stage_of_Cancer",)),
+        ),
+    ),
+    CancerPage(
+        name="Retinoblastoma Cancer",
+        description=(
+            "Retinoblastoma is a rare type of cancer that starts in the retina, "
+            "the light-sensitive tissue at the back of the eye. It usually "
+            "affects young children, often before the age of 5.In this cancer, "
+            "the cells of the retina grow abnormally and uncontrollably, forming "
+            "a tumor. This can affect vision and, if not treated early, may "
+            "spread to other parts of the body"
+        ),
+        heading="Retinoblastoma Cancer",
+        topic="Retinoblastoma",
+        charts=(
+            ChartSpec("fig1", "sunburst", dict(
+                path=["Stage_of_Cancer", "Gender"], values="Survival_Rate",
+                title="👁 Retinoblastoma - Survival Rate by Stage & Gender"),
+                rollup=("Stage_of_Cancer", "Gender")),
+            ChartSpec("fig2", "bar_polar", dict(
+                r="%Cure", theta="Age_Group", color="Gender",
+                title="Retinoblastoma - Cure % by Age Group (Polar Bar)")),
+        ),
+    ),
+)
+
+REGISTRY = {page.name: page for page in PAGES}
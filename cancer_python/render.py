@@ -0,0 +1,124 @@
+"""Generic renderer for the pages described in registry.py."""
+
+from concurrent.futures import as_completed
+
+import plotly.express as px
+import streamlit as st
+
+from compare import comparison, data_versions, pivot
+from content import FRAGMENTS
+from data_loader import dataset_version, load_cancer
+from datasets import METRICS
+from figure_cache import cached_figure
+from figures import submit_figures
+from filters import Selection, get_index
+from profiling import set_label, snapshot, span
+from registry import REGISTRY
+
+# st.fragment needs Streamlit 1.37; older versions rerun the whole script.
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", lambda f: f)
+
+
+def render_filters(cancer_type, index):
+    """Filters for one cancer; returns the ``Selection`` they describe.
+
+    They sit in the page rather than the sidebar because widgets inside a
+    fragment cannot write to the sidebar. Their keys include the cancer, so
+    every cancer keeps its own selection.
+    """
+    categories, ranges = [], []
+    with st.expander("Filters"):
+        for dim, options in index.categories.items():
+            kept = st.multiselect(dim.replace("_", " "), options, default=options,
+                                  key=f"filter:{cancer_type}:{dim}")
+            if len(kept) < len(options):
+                categories.append((dim, tuple(kept)))
+        for metric, (low, high) in ((m, index.bounds(m)) for m in METRICS):
+            if low == high:
+                continue
+            chosen = st.slider(metric, low, high, (low, high),
+                               key=f"filter:{cancer_type}:{metric}")
+            if chosen != (low, high):
+                ranges.append((metric, *chosen))
+    return Selection(tuple(categories), tuple(ranges))
+
+
+@fragment
+def render_cancer(cancer_type):
+    """One cancer's filters, charts and knowledge panel.
+
+    This is a fragment: changing a filter reruns only this function, not the
+    header, banner, About text or the rest of index.py.
+    """
+    set_label(cancer_type)
+    with span("fragment"):
+        with span("load"):
+            df = load_cancer(cancer_type)
+        data_version = dataset_version(cancer_type)
+        index = get_index(cancer_type, df, data_version)
+        selection = render_filters(cancer_type, index)
+        if selection:
+            with span("filter"):
+                df = index.apply(df, selection)
+        render_page(REGISTRY[cancer_type], df, data_version, selection)
+
+
+def render_page(page, df, data_version, selection=None):
+    st.text(page.description)
+
+    if selection:
+        rows = "1 row matches" if len(df) == 1 else f"{len(df):,} rows match"
+        st.caption(f"{rows} the filters")
+    if df.empty:
+        st.info("No rows match the filters.")
+        st.markdown(FRAGMENTS[page.name], unsafe_allow_html=True)
+        return
+
+    # Lay out the whole page first, then fill each chart in as it is ready.
+    slots = [st.empty() for _ in page.charts]
+    for slot in slots:
+        slot.caption("Preparing chart…")
+    futures = submit_figures(page, df, data_version, selection)
+    st.markdown(FRAGMENTS[page.name], unsafe_allow_html=True)
+
+    slot_of = dict(zip(futures, slots))
+    for future in as_completed(futures):
+        with span("send"):
+            slot_of[future].plotly_chart(future.result(), use_container_width=True)
+
+
+def render_comparison(cancer_types, metric, by=None):
+    stats = comparison(metric, by, cancer_types)
+    split = f" by {by}" if by else ""
+    key = f"{metric}|{by}|{'|'.join(sorted(cancer_types))}"
+    versions = data_versions()
+
+    fig = cached_figure("__compare__", "bar:" + key, versions, lambda: px.bar(
+        stats, x="Cancer_Type", y="mean", color=by, error_y="std",
+        barmode="group", text_auto=".1f",
+        labels={"mean": metric, "Cancer_Type": "Cancer"},
+        title=f"Mean {metric}{split} across cancers"))
+    with span("send"):
+        st.plotly_chart(fig, use_container_width=True)
+
+    if by:
+        fig = cached_figure("__compare__", "heatmap:" + key, versions, lambda: px.imshow(
+            pivot(stats, by), text_auto=".1f", aspect="auto",
+            color_continuous_scale="Viridis",
+            labels={"color": metric, "y": "Cancer"},
+            title=f"{metric}: cancer vs {by}"))
+        with span("send"):
+            st.plotly_chart(fig, use_container_width=True)
+
+    st.dataframe(stats, hide_index=True, use_container_width=True)
+
+
+def render_debug_panel(spans):
+    """Timings of this rerun and latency summaries per page, in the sidebar."""
+    with st.sidebar.expander("Timings", expanded=True):
+        st.dataframe([{"span": name, "ms": round(ms, 2)} for name, ms in spans],
+                     hide_index=True, use_container_width=True)
+        rows = [{"page": label, "span": name, "count": s["count"],
+                 "p50_ms": s["p50_ms"], "p95_ms": s["p95_ms"], "max_ms": round(s["max_ms"], 2)}
+                for label, by_span in snapshot().items() for name, s in by_span.items()]
+        st.dataframe(rows, hide_index=True, use_container_width=True)
@@ -0,0 +1,44 @@
+"""Compact in-memory schema shared by every dataset.
+
+Text columns (the dimensions, and Cancer_Type in the files that have one) are
+categoricals with their padding stripped, and the metrics are float32. Every
+loader converts to this form as it reads a file, so charts, the cube, filters
+and the store all work on codes and 4-byte floats rather than Python strings
+and float64.
+"""
+
+import numpy as np
+import pandas as pd
+
+from datasets import METRICS
+
+METRIC_DTYPE = np.float32
+
+
+def strip_categories(series):
+    """``series`` as a categorical with surrounding whitespace removed from its values."""
+    series = series.astype("category")
+    categories = series.cat.categories.astype(str).str.strip()
+    if categories.is_unique:
+        return series.cat.rename_categories(categories)
+    # "Stage IV" and "Stage IV " both present: merge them.
+    return series.astype(str).str.strip().astype("category")
+
+
+def compact(df):
+    """Convert a frame with canonical column names to the compact schema."""
+    for column in df.columns:
+        if column in METRICS:
+            if pd.api.types.is_numeric_dtype(df[column]):
+                df[column] = df[column].astype(METRIC_DTYPE)
+        elif not pd.api.types.is_numeric_dtype(df[column]):
+            df[column] = strip_categories(df[column])
+    return df
+
+
+def memory_report(raw, compacted):
+    """Bytes of a frame as ``pd.read_csv`` returns it and in the compact schema."""
+    before = int(raw.memory_usage(deep=True).sum())
+    after = int(compacted.memory_usage(deep=True).sum())
+    return {"rows": len(raw), "raw_bytes": before, "compact_bytes": after,
+            "ratio": before / max(after, 1)}
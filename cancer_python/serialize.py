@@ -0,0 +1,107 @@
+"""Fast JSON encoding of Plotly figures.
+
+``figure_json`` encodes with orjson when it is installed: it serializes NumPy
+arrays natively instead of converting them element by element through
+Plotly's default encoder. ``browser_figure`` further replaces the numeric
+arrays of every trace with Plotly.js typed-array specs
+(``{"dtype": "f8", "bdata": <base64>}``, understood since Plotly.js 2.28).
+The output is smaller and decodes without parsing one number at a time. It
+is meant for JSON handed straight to Plotly.js, such as the static site.
+
+``measure`` reports time and bytes of each encoding for one figure, and the
+``serialize/...`` benchmarks in benchmarks.py time them for every chart.
+"""
+
+import base64
+import json
+import time
+
+import numpy as np
+import plotly.io as pio
+from plotly.utils import PlotlyJSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ENGINE = "orjson" if orjson is not None else "json"
+# Shorter arrays are about as small as plain JSON lists, and easier to read.
+MIN_TYPED_LENGTH = 64
+
+_ENCODER = PlotlyJSONEncoder()
+_DTYPES = {"float64": "f8", "float32": "f4", "int32": "i4", "uint32": "u4",
+           "int16": "i2", "uint16": "u2", "int8": "i1", "uint8": "u1"}
+
+
+def figure_json(fig):
+    """The figure as JSON text, through the fastest available encoder."""
+    return pio.to_json(fig, validate=False, engine=ENGINE)
+
+
+def loads(text):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def browser_figure(fig):
+    """The figure as a dict whose numeric trace arrays are base64 typed arrays.
+
+    Other values are left as ``to_plotly_json`` gives them, NumPy arrays and
+    scalars included; encode it with ``browser_json`` or ``PlotlyJSONEncoder``.
+    """
+    spec = fig.to_plotly_json()
+    return {"data": [_encode_arrays(trace) for trace in spec["data"]], "layout": spec["layout"]}
+
+
+def browser_json(fig):
+    """``browser_figure`` as JSON text."""
+    return _dumps(browser_figure(fig))
+
+
+def measure(fig):
+    """``{encoding: {"ms": ..., "bytes": ...}}`` for Plotly's default and the fast paths."""
+    encoders = {
+        "plotly_json": lambda: pio.to_json(fig, validate=False, engine="json"),
+        "fast": lambda: figure_json(fig),
+        "typed_arrays": lambda: browser_json(fig),
+    }
+    result = {}
+    for name, encode in encoders.items():
+        started = time.perf_counter()
+        text = encode()
+        result[name] = {"ms": (time.perf_counter() - started) * 1000, "bytes": len(text)}
+    return result
+
+
+def _encode_arrays(value):
+    if isinstance(value, dict):
+        return {key: _encode_arrays(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], dict):
+        return [_encode_arrays(item) for item in value]
+    typed = _typed_array(value)
+    return value if typed is None else typed
+
+
+def _typed_array(value):
+    if isinstance(value, (list, tuple)) and len(value) >= MIN_TYPED_LENGTH:
+        if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value):
+            return None
+        value = np.asarray(value)
+    if not isinstance(value, np.ndarray) or value.ndim != 1 or value.size < MIN_TYPED_LENGTH:
+        return None
+    if value.dtype.kind in "iu" and value.dtype.itemsize == 8:
+        # Plotly.js has no 64-bit integer arrays.
+        info = np.iinfo(np.int32)
+        fits = value.size and info.min <= value.min() and value.max() <= info.max
+        value = value.astype(np.int32 if fits else np.float64)
+    code = _DTYPES.get(value.dtype.name)
+    if code is None:
+        return None
+    data = np.ascontiguousarray(value, dtype=value.dtype.newbyteorder("<")).tobytes()
+    return {"dtype": code, "bdata": base64.b64encode(data).decode("ascii")}
+
+
+def _dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY, default=_ENCODER.default)
+    return json.dumps(obj, cls=PlotlyJSONEncoder)
@@ -0,0 +1,23 @@
+"""Start the dashboard with its caches warming up from process boot.
+
+Usage: python serve.py [streamlit run options]
+
+``streamlit run index.py`` only imports the app when the first session
+connects, so that session would pay for the warm-up. This launcher starts
+warmup.py's background warm-up, and the readiness endpoint if
+CANCER_READY_PORT is set, in the server process itself, then hands over to
+Streamlit.
+"""
+
+import os
+import sys
+
+from streamlit.web import cli
+
+from datasets import DATA_DIR
+from warmup import start_warmup
+
+if __name__ == "__main__":
+    start_warmup()
+    sys.argv = ["streamlit", "run", os.path.join(DATA_DIR, "index.py")] + sys.argv[1:]
+    sys.exit(cli.main())
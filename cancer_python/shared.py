@@ -0,0 +1,114 @@
+"""Build the consolidated store once per node and let every worker map it.
+
+Without the store each Streamlit worker process parses and holds its own copy
+of every dataset it has touched. ``ensure_shared`` builds cancer_store/ the
+first time any worker starts, if it is missing or no longer matches the
+sha256 of every CSV. It fingerprints the files as they are now, not as this
+worker last saw them, so a worker never rebuilds the store from an older
+copy of a file than another worker already ingested. A file lock makes the
+other workers wait for a build rather than repeat it. Every worker then maps
+the same ``.npy`` files read-only, so the column data lives once in the OS
+page cache however many workers read it.
+
+The check runs once per process; after that the watcher reports changed
+files through ``refresh_shared``. A build that failed is not retried until
+one of the files changes.
+
+Set CANCER_SHARED_STORE=0 to leave the store to ``python ingest.py``, for
+instance when the project directory is read-only.
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent builds are redundant but still safe
+    fcntl = None
+
+from datasets import CANCER_FILES
+from ingest import ingest, reingest
+from manifest import ManifestError, fresh_datasets
+from store import STORE_DIR, get_store
+
+ENABLED = os.environ.get("CANCER_SHARED_STORE", "1") != "0"
+
+logger = logging.getLogger("cancer.shared")
+
+_checked = False
+_failed = set()  # fingerprints of the file versions no store could be built from
+_lock = threading.Lock()
+
+
+def is_current(store, entries):
+    """Whether ``store`` holds every dataset exactly as ``{cancer_type: Entry}`` describes it."""
+    if store is None:
+        return False
+    sources = store.meta.get("sources", {})
+    return all(sources.get(name, {}).get("sha256") == entries[name].sha256
+               for name in CANCER_FILES)
+
+
+def ensure_shared(path=STORE_DIR, recheck=False):
+    """Return the shared store, building it first if it is missing or stale.
+
+    Only the first call of the process, or one with ``recheck``, looks at the
+    files; later calls return the store as it is. Returns None when it cannot
+    be built; callers then fall back to parsing the CSVs in this process.
+    """
+    global _checked
+    if not ENABLED or (_checked and not recheck):
+        return get_store(path)
+    with _lock:
+        if _checked and not recheck:
+            return get_store(path)
+        _checked = True
+        fingerprint = None
+        try:
+            entries = fresh_datasets()
+            fingerprint = tuple(entries[name].sha256 for name in CANCER_FILES)
+            if fingerprint in _failed:
+                return None
+            store = get_store(path, refresh=True)
+            if is_current(store, entries):
+                return store
+            with _file_lock(path + ".lock"):
+                # Another worker may have finished the build while we waited.
+                store = get_store(path, refresh=True)
+                if not is_current(store, entries):
+                    ingest(path, verbose=False)
+                    store = get_store(path)
+        except (OSError, ValueError, ManifestError) as exc:
+            if fingerprint is not None:
+                _failed.add(fingerprint)
+            logger.warning("could not build the shared store at %s: %s", path, exc)
+            return None
+        return store
+
+
+def refresh_shared(cancer_type, df, entry, path=STORE_DIR):
+    """Replace one cancer in the shared store with its new, validated frame ``df``."""
+    with _file_lock(path + ".lock"):
+        store = get_store(path, refresh=True)
+        # Every worker notices the change; only the first one rewrites the store.
+        if store is not None and (
+                store.meta["sources"].get(cancer_type, {}).get("sha256") != entry.sha256):
+            reingest(cancer_type, df, entry, path)
+    if store is None:
+        # The store was never built, e.g. because this file was broken before.
+        return ensure_shared(path, recheck=True)
+    return get_store(path)
+
+
+@contextmanager
+def _file_lock(path):
+    with open(path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
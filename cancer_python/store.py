@@ -0,0 +1,186 @@
+"""Consolidated columnar store holding every cancer dataset.
+
+Each version of the store is a directory of ``.npy`` files, one per column,
+plus ``meta.json``. Categorical columns are written as integer codes with their
+categories kept in the metadata, and rows are grouped by cancer so that one
+cancer is a contiguous slice. ``np.load(mmap_mode="r")`` maps the arrays
+straight from disk, so loading the store costs no parsing at all.
+
+Versions live side by side under the store directory, and the file
+``CURRENT`` names the one to read. A writer fills a new version and then
+renames a new ``CURRENT`` over the old one, so a reader always sees either
+the whole old store or the whole new one, never a missing or half-written
+directory. A process reads ``CURRENT`` once and keeps the store in memory; a
+write in the same process replaces it, and the dataset watcher picks up
+writes by other processes with ``get_store(refresh=True)``.
+"""
+
+import contextlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+from datasets import DATA_DIR, DIMENSIONS, METRICS
+from schema import METRIC_DTYPE
+
+STORE_DIR = os.path.join(DATA_DIR, "cancer_store")
+CATEGORICAL_COLUMNS = ("Cancer_Type",) + DIMENSIONS
+FORMAT_VERSION = 2
+POINTER = "CURRENT"
+
+_loaded = {}  # absolute store path -> CancerStore, or None while it has none
+_lock = threading.Lock()
+
+
+class CancerStore:
+    """Read-only view over a loaded store."""
+
+    def __init__(self, frame, offsets, meta, version=None):
+        self.frame = frame
+        self.offsets = offsets
+        self.meta = meta
+        self.version = version
+        self._slices = {}  # cancer_type -> frame; one store object per version
+
+    @property
+    def cancer_types(self):
+        return list(self.offsets)
+
+    def cancer(self, cancer_type):
+        """One cancer's rows: a slice of the memory maps, copying no column data.
+
+        The slice keeps the store's row labels and its categories, including
+        ones this cancer does not use; every groupby passes ``observed=True``.
+        """
+        frame = self._slices.get(cancer_type)
+        if frame is None:
+            start, stop = self.offsets[cancer_type]
+            frame = self._slices[cancer_type] = self.frame.iloc[start:stop]
+        return frame.copy(deep=False)
+
+
+def write_store(frames, path=STORE_DIR, sources=None):
+    """Write ``{cancer_type: frame}`` as a store at ``path``, replacing any old one."""
+    parts, offsets, start = [], {}, 0
+    for cancer_type, df in frames.items():
+        part = df.loc[:, list(DIMENSIONS + METRICS)]
+        part.insert(0, "Cancer_Type", cancer_type)
+        parts.append(part)
+        offsets[cancer_type] = (start, start + len(part))
+        start += len(part)
+    combined = pd.concat(parts, ignore_index=True)
+
+    meta = {
+        "format": FORMAT_VERSION,
+        "rows": len(combined),
+        "offsets": offsets,
+        "categories": {},
+        "metrics": list(METRICS),
+        "sources": sources or {},
+    }
+    tmp = new_version(path)
+    try:
+        for column in CATEGORICAL_COLUMNS:
+            values = pd.Categorical(combined[column])
+            meta["categories"][column] = [str(c) for c in values.categories]
+            np.save(os.path.join(tmp, column_file(column)), values.codes)
+        for column in METRICS:
+            np.save(os.path.join(tmp, column_file(column)),
+                    combined[column].to_numpy(dtype=METRIC_DTYPE))
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+        publish(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return path
+
+
+def new_version(path=STORE_DIR):
+    """Create an empty directory for the next version of the store at ``path``."""
+    os.makedirs(path, exist_ok=True)
+    return tempfile.mkdtemp(prefix=".tmp-", dir=path)
+
+
+def publish(tmp, path=STORE_DIR):
+    """Make the fully written version in ``tmp`` the current store, atomically.
+
+    The version it replaces is kept, because a reader may have read the old
+    ``CURRENT`` and not yet opened its files; older versions are removed.
+    """
+    previous = current_version(path)
+    version = os.path.join(path, "v-" + os.path.basename(tmp)[len(".tmp-"):])
+    os.rename(tmp, version)
+    pointer = os.path.join(path, POINTER)
+    staged = f"{pointer}.{os.getpid()}.{threading.get_ident()}"
+    with open(staged, "w") as f:
+        f.write(os.path.basename(version))
+    os.replace(staged, pointer)
+    with _lock:
+        _loaded.pop(os.path.abspath(path), None)
+
+    keep = {os.path.basename(version), previous}
+    published = os.stat(version).st_mtime_ns
+    for name in os.listdir(path):
+        old = os.path.join(path, name)
+        if name.startswith("v-") and name not in keep and os.stat(old).st_mtime_ns < published:
+            shutil.rmtree(old, ignore_errors=True)
+        elif name == "meta.json" or name.endswith(".npy"):
+            # A store written before versions existed.
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(old)
+
+
+def current_version(path=STORE_DIR):
+    """Name of the version directory ``CURRENT`` points to, or None before the first ingest."""
+    try:
+        with open(os.path.join(path, POINTER)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def load_store(path=STORE_DIR, mmap_mode="r", version=None):
+    """Load the store at ``path``; returns ``None`` when it has not been built."""
+    version = version or current_version(path)
+    if version is None:
+        return None
+    directory = os.path.join(path, version)
+    with open(os.path.join(directory, "meta.json")) as f:
+        meta = json.load(f)
+    if meta.get("format") != FORMAT_VERSION:
+        return None
+
+    columns = {}
+    for column in CATEGORICAL_COLUMNS:
+        codes = np.load(os.path.join(directory, column_file(column)), mmap_mode=mmap_mode)
+        columns[column] = pd.Categorical.from_codes(codes, meta["categories"][column])
+    for column in meta["metrics"]:
+        columns[column] = np.load(os.path.join(directory, column_file(column)),
+                                  mmap_mode=mmap_mode)
+    frame = pd.DataFrame(columns, copy=False)
+    offsets = {name: tuple(bounds) for name, bounds in meta["offsets"].items()}
+    return CancerStore(frame, offsets, meta, version)
+
+
+def get_store(path=STORE_DIR, refresh=False):
+    """Return the process-wide store, reading ``CURRENT`` only on first use or ``refresh``."""
+    key = os.path.abspath(path)
+    with _lock:
+        if key in _loaded and not refresh:
+            return _loaded[key]
+        version = current_version(path)
+        store = _loaded.get(key)
+        if store is None or store.version != version:
+            store = load_store(path, version=version) if version else None
+        _loaded[key] = store
+        return store
+
+
+def column_file(column):
+    return column.replace("%", "pct_") + ".npy"
@@ -0,0 +1,212 @@
+"""Streaming, resumable ingest for datasets too large to load in one piece.
+
+The CSV is read in chunks with compact dtypes (float32 metrics, categorical
+dimensions). Each chunk is folded into the cube partials (exact sums, counts,
+minima and maxima per Age_Group x Gender x Stage cell) and into a uniform
+bottom-k sample of at most ``SAMPLE_ROWS`` rows. Memory stays bounded by the
+chunk size, whatever the size of the file.
+
+Chunks are whole lines cut from the raw bytes of the file, so every
+checkpoint records the byte offset after its last row. An interrupted run
+seeks straight back to the last checkpoint, as long as the source file has
+not changed, instead of reading and discarding the rows it already folded.
+Rows must not contain quoted line breaks; the datasets have none. The dashboard
+then plots rollups from the exact partials and row-level charts from the
+sample.
+"""
+
+import io
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+from cube import fold_partials, partial_aggregates
+from datasets import COLUMN_RENAMES, DATA_DIR, DIMENSIONS, METRICS, REQUIRED_COLUMNS
+from manifest import dataset_path, get_manifest
+from schema import METRIC_DTYPE, strip_categories
+
+AGGREGATE_DIR = os.path.join(DATA_DIR, "cancer_aggregates")
+CHUNK_ROWS = 1_000_000
+SAMPLE_ROWS = 50_000
+CHECKPOINT_EVERY = 10
+SEED = 0
+
+_loaded = {}  # checkpoint path -> (mtime_ns, checkpoint), (None, None) if there is none
+_lock = threading.Lock()
+
+
+def stream_ingest(cancer_type, path=None, out_dir=AGGREGATE_DIR, chunksize=CHUNK_ROWS,
+                  sample_rows=SAMPLE_ROWS, checkpoint_every=CHECKPOINT_EVERY, progress=True):
+    """Fold ``path`` (default: the cancer's catalogue file) into a checkpoint."""
+    path = os.path.abspath(path or dataset_path(cancer_type))
+    source = _source(path)
+    target = checkpoint_path(cancer_type, out_dir)
+
+    state = _read(target)
+    # Checkpoints written before offsets were recorded cannot be resumed.
+    if state is not None and state["source"] == source and "offset" in state:
+        if state["complete"]:
+            if progress:
+                print(f"{cancer_type}: up to date ({state['rows']:,} rows)", file=sys.stderr)
+            return state
+    else:
+        state = {"cancer_type": cancer_type, "source": source, "rows": 0, "chunks": 0,
+                 "offset": None, "complete": False, "partials": None, "sample": None}
+
+    with open(path, "rb") as f:
+        header = f.readline()
+        names = list(pd.read_csv(io.BytesIO(header), nrows=0).columns)
+        raw = _raw_columns(names, path)
+        dtype = {raw[c]: "category" for c in DIMENSIONS}
+        dtype.update({raw[c]: METRIC_DTYPE for c in METRICS})
+        f.seek(state["offset"] or len(header))
+        for block, offset in _line_blocks(f, chunksize):
+            chunk = pd.read_csv(io.BytesIO(block), header=None, names=names,
+                                usecols=[raw[c] for c in REQUIRED_COLUMNS], dtype=dtype)
+            chunk = chunk.rename(columns=COLUMN_RENAMES)
+            for column in DIMENSIONS:
+                chunk[column] = strip_categories(chunk[column])
+            partials = partial_aggregates(chunk)
+            if state["partials"] is not None:
+                partials = fold_partials(state["partials"], partials)
+            rng = np.random.default_rng([SEED, state["chunks"]])
+            state.update(partials=partials,
+                         sample=_bottom_k(state["sample"], chunk, sample_rows, rng),
+                         rows=state["rows"] + len(chunk), chunks=state["chunks"] + 1,
+                         offset=offset)
+            if state["chunks"] % checkpoint_every == 0:
+                _write(target, state)
+            if progress:
+                done = offset / max(source["size"], 1)
+                print(f"\r{cancer_type}: {done:6.1%}  {state['rows']:,} rows",
+                      end="", file=sys.stderr, flush=True)
+
+    state["complete"] = True
+    _write(target, state)
+    if progress:
+        print(f"\r{cancer_type}: done  {state['rows']:,} rows", file=sys.stderr)
+    return state
+
+
+def load_streamed(cancer_type, out_dir=AGGREGATE_DIR):
+    """The completed checkpoint of ``cancer_type`` if it matches the current file.
+
+    Checkpoints are read once and kept in memory. A run of ``stream_ingest``
+    in this process replaces its checkpoint; ``reload_checkpoints`` picks up
+    runs in other processes. The file is compared with its manifest entry,
+    which the dataset watcher keeps up to date.
+    """
+    target = checkpoint_path(cancer_type, out_dir)
+    with _lock:
+        entry = _loaded.get(target)
+    if entry is None:
+        entry = _load(target)
+    state = entry[1]
+    if not state or not state["complete"]:
+        return None
+    dataset = get_manifest().datasets[cancer_type]
+    source = {"file": os.path.abspath(dataset.path), "size": dataset.size,
+              "mtime_ns": dataset.mtime_ns}
+    return state if state["source"] == source else None
+
+
+def reload_checkpoints():
+    """Forget the loaded checkpoints whose file changed since; the watcher calls this."""
+    with _lock:
+        loaded = dict(_loaded)
+    for target, (mtime, _) in loaded.items():
+        if _mtime(target) != mtime:
+            with _lock:
+                _loaded.pop(target, None)
+
+
+def sample_frame(state):
+    """The checkpoint's sample as a dashboard frame; ``attrs`` hold the full row count."""
+    frame = state["sample"].drop(columns="_key").reset_index(drop=True)
+    for column in DIMENSIONS:
+        frame[column] = frame[column].astype("category")
+    frame.attrs["total_rows"] = state["rows"]
+    return frame
+
+
+def checkpoint_path(cancer_type, out_dir=AGGREGATE_DIR):
+    slug = "".join(c if c.isalnum() else "_" for c in cancer_type.lower())
+    return os.path.join(out_dir, slug + ".pkl")
+
+
+def _source(path):
+    stat = os.stat(path)
+    return {"file": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _raw_columns(header, path):
+    """Canonical column name -> name used in the file's header."""
+    raw = {COLUMN_RENAMES.get(c, c): c for c in header}
+    missing = [c for c in REQUIRED_COLUMNS if c not in raw]
+    if missing:
+        raise ValueError(f"{path}: missing columns {missing}")
+    return raw
+
+
+def _line_blocks(f, rows, probe=1 << 16):
+    """Yield ``(block, offset)``: about ``rows`` whole lines of ``f`` and the offset past them."""
+    start = f.tell()
+    head = f.read(probe)
+    f.seek(start)
+    block_bytes = max(rows * len(head) // max(head.count(b"\n"), 1), probe)
+    carry = b""
+    while True:
+        data = f.read(block_bytes)
+        if not data:
+            break
+        data = carry + data
+        cut = data.rfind(b"\n") + 1
+        if cut == 0:
+            carry = data  # a line longer than the block; read on
+            continue
+        block, carry = data[:cut], data[cut:]
+        yield block, f.tell() - len(carry)
+    if carry.strip():
+        yield carry, f.tell()
+
+
+def _bottom_k(sample, chunk, k, rng):
+    """Keep the ``k`` rows with the smallest random keys seen so far: a uniform sample."""
+    chunk = chunk.assign(_key=rng.random(len(chunk)))
+    if sample is not None:
+        chunk = pd.concat([sample, chunk], ignore_index=True)
+    return chunk.nsmallest(k, "_key") if len(chunk) > k else chunk
+
+
+def _mtime(target):
+    try:
+        return os.stat(target).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _load(target):
+    mtime = _mtime(target)
+    entry = (mtime, _read(target) if mtime is not None else None)
+    with _lock:
+        _loaded[target] = entry
+    return entry
+
+
+def _read(target):
+    try:
+        return pd.read_pickle(target)
+    except FileNotFoundError:
+        return None
+
+
+def _write(target, state):
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = target + ".tmp"
+    pd.to_pickle(state, tmp)
+    os.replace(tmp, target)
+    with _lock:
+        _loaded[target] = (_mtime(target), dict(state))
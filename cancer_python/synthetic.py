@@ -0,0 +1,184 @@
+"""Synthetic cancer datasets with the same schema and categories as the CSVs.
+
+Survival falls with stage and age, Death_Rate is 100 - Survival_Rate, and
+%Cure never exceeds the survival rate, so charts and aggregates behave like
+they do on the real data at any row count.
+
+Usage: python synthetic.py ROWS OUT [--format csv|store] [--chunk-rows N]
+                           [--jobs N] [--seed N] [--cancer NAME]
+
+Rows are generated in independent chunks across worker processes, so memory
+stays bounded by the chunk size and the output is the same for any number of
+workers. ``csv`` writes one CSV in the datasets' schema, ready for
+``streaming.stream_ingest(cancer_type, path=...)``; ``store`` writes a
+one-cancer columnar store that ``store.load_store`` maps directly.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from datasets import METRICS
+from schema import METRIC_DTYPE
+from store import CATEGORICAL_COLUMNS, FORMAT_VERSION, column_file, new_version, publish
+
+AGE_GROUPS = ("0-19", "20-29", "30-39", "40-49", "50-59", "60-69", "70-79", "80+")
+GENDERS = ("Male", "Female", "Transgender")
+STAGES = ("Stage I", "Stage II", "Stage III", "Stage IV")
+CHUNK_ROWS = 1_000_000
+
+_STAGE_WEIGHTS = np.array([0.15, 0.3, 0.3, 0.25])
+_STAGE_SURVIVAL = np.array([85.0, 65.0, 40.0, 15.0])
+_AGE_PENALTY = np.linspace(0.0, 20.0, len(AGE_GROUPS))
+_CATEGORIES = {"Age_Group": AGE_GROUPS, "Gender": GENDERS, "Stage_of_Cancer": STAGES}
+
+
+def generate(n_rows, seed=0, chunk=0):
+    """A frame of ``n_rows`` rows in the column order of the CSVs and the compact schema.
+
+    Each ``(seed, chunk)`` pair has its own random stream, so chunks can be
+    generated independently and in any order.
+    """
+    rng = np.random.default_rng([seed, chunk])
+    age = rng.integers(0, len(AGE_GROUPS), n_rows, dtype=np.int8)
+    gender = rng.integers(0, len(GENDERS), n_rows, dtype=np.int8)
+    stage = rng.choice(len(STAGES), n_rows, p=_STAGE_WEIGHTS).astype(np.int8)
+
+    survival = _STAGE_SURVIVAL[stage] - _AGE_PENALTY[age] + rng.normal(0.0, 8.0, n_rows)
+    survival = np.clip(survival, 0.5, 99.5).round(2)
+    death = (100.0 - survival).round(2)
+    cure = (survival * rng.uniform(0.55, 0.95, n_rows)).round(2)
+
+    return pd.DataFrame({
+        "Age_Group": pd.Categorical.from_codes(age, AGE_GROUPS),
+        "Gender": pd.Categorical.from_codes(gender, GENDERS),
+        "%Cure": cure.astype(METRIC_DTYPE),
+        "Survival_Rate": survival.astype(METRIC_DTYPE),
+        "Death_Rate": death.astype(METRIC_DTYPE),
+        "Stage_of_Cancer": pd.Categorical.from_codes(stage, STAGES),
+    })
+
+
+def chunks(n_rows, chunk_rows=CHUNK_ROWS):
+    """``(chunk, start, size)`` for every chunk of an ``n_rows`` dataset."""
+    return [(i, start, min(chunk_rows, n_rows - start))
+            for i, start in enumerate(range(0, n_rows, chunk_rows))]
+
+
+def write_csv(n_rows, path, chunk_rows=CHUNK_ROWS, jobs=None, seed=0, progress=True):
+    """Write ``n_rows`` synthetic rows to the CSV at ``path``."""
+    tmp = path + ".tmp"
+    window = 2 * (jobs or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=jobs) as pool, open(tmp, "wb") as f:
+        tasks = [(seed, i, size) for i, _, size in chunks(n_rows, chunk_rows)]
+        for done, data in enumerate(_ordered(pool, _csv_chunk, tasks, window), 1):
+            f.write(data)
+            _report(progress, path, done, len(tasks))
+    os.replace(tmp, path)
+    return path
+
+
+def write_synthetic_store(n_rows, path, cancer_type="Synthetic", chunk_rows=CHUNK_ROWS,
+                          jobs=None, seed=0, progress=True):
+    """Write ``n_rows`` synthetic rows as a one-cancer store at ``path``.
+
+    The column files are preallocated and every worker fills its own slice of
+    them through a writable memory map.
+    """
+    tmp = new_version(path)
+    try:
+        categories = dict(_CATEGORIES, Cancer_Type=(cancer_type,))
+        for column in CATEGORICAL_COLUMNS:
+            np.lib.format.open_memmap(os.path.join(tmp, column_file(column)), mode="w+",
+                                      dtype=np.int8, shape=(n_rows,))
+        for column in METRICS:
+            np.lib.format.open_memmap(os.path.join(tmp, column_file(column)), mode="w+",
+                                      dtype=METRIC_DTYPE, shape=(n_rows,))
+        window = 2 * (jobs or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            tasks = [(tmp, seed, i, start, size) for i, start, size in chunks(n_rows, chunk_rows)]
+            for done, _ in enumerate(_ordered(pool, _store_chunk, tasks, window), 1):
+                _report(progress, path, done, len(tasks))
+
+        meta = {
+            "format": FORMAT_VERSION,
+            "rows": n_rows,
+            "offsets": {cancer_type: [0, n_rows]},
+            "categories": {c: list(categories[c]) for c in CATEGORICAL_COLUMNS},
+            "metrics": list(METRICS),
+            "sources": {cancer_type: {"synthetic": True, "seed": seed}},
+        }
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+        publish(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return path
+
+
+def _csv_chunk(seed, chunk, size):
+    return generate(size, seed, chunk).to_csv(index=False, header=chunk == 0).encode()
+
+
+def _store_chunk(directory, seed, chunk, start, size):
+    df = generate(size, seed, chunk)
+    for column in CATEGORICAL_COLUMNS:
+        out = np.load(os.path.join(directory, column_file(column)), mmap_mode="r+")
+        # A one-cancer store has the single Cancer_Type code 0.
+        out[start:start + size] = df[column].cat.codes if column in df else 0
+        out.flush()
+    for column in METRICS:
+        out = np.load(os.path.join(directory, column_file(column)), mmap_mode="r+")
+        out[start:start + size] = df[column]
+        out.flush()
+
+
+def _ordered(pool, func, tasks, window):
+    """``pool.map`` in task order with at most ``window`` results in flight."""
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.submit(func, *task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _report(progress, path, done, total):
+    if progress:
+        print(f"\r{path}: {done}/{total} chunks", end="" if done < total else "\n",
+              file=sys.stderr, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("rows", type=int, help="number of rows to generate")
+    parser.add_argument("out", help="output CSV file or store directory")
+    parser.add_argument("--format", choices=("csv", "store"), default="csv")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPUs)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cancer", default="Synthetic", help="cancer name in a store")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.format == "csv":
+        write_csv(args.rows, args.out, args.chunk_rows, args.jobs, args.seed)
+    else:
+        write_synthetic_store(args.rows, args.out, args.cancer, args.chunk_rows,
+                              args.jobs, args.seed)
+    print(f"wrote {args.rows:,} rows to {args.out} in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
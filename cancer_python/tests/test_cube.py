@@ -0,0 +1,85 @@
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cube import (appearance_order, build_cube, cube_from_partials, fold_partials, get_cube,
+                  invalidate, partial_aggregates)
+from datasets import DIMENSIONS, METRICS
+from synthetic import generate
+
+
+@pytest.fixture(scope="module")
+def df():
+    return generate(4_000, seed=11)
+
+
+def parts(df, cuts=(900, 2_500)):
+    return [partial_aggregates(df.iloc[a:b]) for a, b in zip((0,) + cuts, cuts + (len(df),))]
+
+
+def test_fold_partials_is_associative_and_exact(df):
+    a, b, c = parts(df)
+    whole = partial_aggregates(df).sort_index()
+    left = fold_partials(fold_partials(a, b), c).sort_index()
+    right = fold_partials(a, fold_partials(b, c)).sort_index()
+    pd.testing.assert_frame_equal(left, right)
+    pd.testing.assert_frame_equal(left, whole)
+    pd.testing.assert_frame_equal(fold_partials(c, a, b).sort_index(), whole)
+
+
+@pytest.mark.parametrize("dims", [dims for size in range(1, len(DIMENSIONS) + 1)
+                                  for dims in combinations(DIMENSIONS, size)])
+def test_rollups_match_a_groupby(df, dims):
+    cube = build_cube(df)
+    expected = (df.groupby(list(dims), observed=True, sort=False)[list(METRICS)]
+                .agg(["sum", "mean", "count", "min", "max"]))
+    table = cube.rollup(dims)
+    np.testing.assert_allclose(table.to_numpy(), expected.loc[table.index].to_numpy(), rtol=1e-5)
+    assert len(table) == len(expected)
+
+
+def test_grand_total(df):
+    cube = build_cube(df)
+    assert cube.value("Survival_Rate", "count") == len(df)
+    assert cube.value("Survival_Rate") == pytest.approx(df["Survival_Rate"].astype("float64").mean())
+    assert cube.value("Death_Rate", "max", Gender="Male") == df.loc[
+        df["Gender"] == "Male", "Death_Rate"].max()
+
+
+def test_rollup_rows_follow_first_appearance(df):
+    # Shuffled so that the appearance order differs from the category order.
+    shuffled = df.sample(frac=1, random_state=1).reset_index(drop=True)
+    order = appearance_order(shuffled)
+    assert order["Gender"] == list(pd.unique(shuffled["Gender"]))
+    cube = build_cube(shuffled)
+    for dim in DIMENSIONS:
+        assert list(cube.table((dim,))[dim]) == order[dim]
+    pairs = cube.table(("Age_Group", "Gender"))
+    ranks = [(order["Age_Group"].index(a), order["Gender"].index(g))
+             for a, g in zip(pairs["Age_Group"], pairs["Gender"])]
+    assert ranks == sorted(ranks)
+
+
+def test_cube_from_streamed_partials_equals_build_cube(df):
+    streamed = cube_from_partials(fold_partials(*parts(df)), appearance_order(df))
+    built = build_cube(df)
+    for size in range(len(DIMENSIONS) + 1):
+        for dims in combinations(DIMENSIONS, size):
+            pd.testing.assert_frame_equal(streamed.rollup(dims), built.rollup(dims))
+
+
+def test_get_cube_builds_once_per_version(df):
+    invalidate()
+    first = get_cube("Synthetic", df, "v1")
+    assert get_cube("Synthetic", df, "v1") is first
+    assert get_cube("Synthetic", df, "v2") is not first
+    invalidate("Synthetic")
+    assert get_cube("Synthetic", df, "v1") is not first
+    invalidate()
+
+
+def test_unknown_dimension_is_rejected(df):
+    with pytest.raises(KeyError):
+        build_cube(df).table(("Cancer_Type",))
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cube import build_cube, get_cube, invalidate, selection_cube
+from datasets import DIMENSIONS, METRICS
+from filters import FilterIndex, Selection
+from synthetic import generate
+
+
+@pytest.fixture(scope="module")
+def df():
+    return generate(3_000, seed=7)
+
+
+def scan(df, selection):
+    """Row positions of ``selection`` by comparing every value."""
+    keep = np.ones(len(df), dtype=bool)
+    for dim, values in selection.categories:
+        keep &= df[dim].isin(values).to_numpy()
+    for metric, low, high in selection.ranges:
+        values = df[metric].to_numpy()
+        low, high = np.array([low, high], dtype=values.dtype)
+        keep &= (values >= low) & (values <= high)
+    return np.flatnonzero(keep)
+
+
+def random_selections(df, count, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        categories = tuple(
+            (dim, tuple(rng.choice(df[dim].cat.categories, rng.integers(1, 3), replace=False)))
+            for dim in DIMENSIONS if rng.random() < 0.5)
+        ranges = []
+        for metric in METRICS:
+            if rng.random() < 0.5:
+                # Bounds taken from the data, so ties at the edges are exercised.
+                low, high = np.sort(rng.choice(df[metric].to_numpy(), 2))
+                ranges.append((metric, float(str(low)), float(str(high))))
+        yield Selection(categories, tuple(ranges))
+
+
+def test_mask_equals_a_boolean_scan(df):
+    index = FilterIndex(df)
+    for selection in random_selections(df, 50):
+        np.testing.assert_array_equal(index.positions(selection), scan(df, selection))
+
+
+def test_empty_selection_keeps_every_row(df):
+    assert len(FilterIndex(df).positions(Selection())) == len(df)
+
+
+def test_unknown_category_matches_nothing(df):
+    selection = Selection(categories=(("Gender", ("Unknown",)),))
+    assert len(FilterIndex(df).positions(selection)) == 0
+
+
+def test_categories_without_rows_are_not_offered(df):
+    # Store slices keep the categories of every cancer in the store.
+    widened = df.assign(Gender=df["Gender"].cat.add_categories(["Other"]))
+    index = FilterIndex(widened)
+    assert "Other" not in index.categories["Gender"]
+    assert index.bounds("Survival_Rate") == (float(str(df["Survival_Rate"].min())),
+                                             float(str(df["Survival_Rate"].max())))
+
+
+@pytest.mark.parametrize("selection", [
+    Selection(categories=(("Gender", ("Male",)), ("Stage_of_Cancer", ("Stage I", "Stage IV")))),
+    Selection(ranges=(("Survival_Rate", 40.0, 80.0),)),
+])
+def test_selection_cube_equals_a_cube_of_the_selected_rows(df, selection):
+    invalidate()
+    get_cube("Synthetic", df, "v1")
+    rows = FilterIndex(df).apply(df, selection)
+    expected = build_cube(rows)
+    cube = selection_cube("Synthetic", rows, "v1", selection)
+    for dims in [(), ("Gender",), ("Age_Group", "Stage_of_Cancer"), DIMENSIONS]:
+        # A cut of the full cube keeps the categories the selection drops.
+        pd.testing.assert_frame_equal(cube.rollup(dims), expected.rollup(dims),
+                                      check_categorical=False)
+    invalidate()
@@ -0,0 +1,80 @@
+import os
+
+import numpy as np
+import pytest
+
+from store import POINTER, current_version, get_store, load_store, write_store
+from synthetic import generate
+
+
+@pytest.fixture
+def frames():
+    return {"Lung Cancer": generate(300, seed=1), "Skin Cancer": generate(200, seed=2)}
+
+
+def versions(path):
+    return sorted(name for name in os.listdir(path) if name.startswith("v-"))
+
+
+def test_round_trip(tmp_path, frames):
+    path = write_store(frames, str(tmp_path), sources={"Lung Cancer": {"sha256": "a"}})
+    store = load_store(path)
+    assert store.cancer_types == list(frames)
+    for name, df in frames.items():
+        rows = store.cancer(name).reset_index(drop=True)
+        for column in df.columns:
+            assert list(rows[column]) == list(df[column])
+    assert store.meta["sources"] == {"Lung Cancer": {"sha256": "a"}}
+
+
+def test_slices_are_read_only(tmp_path, frames):
+    store = load_store(write_store(frames, str(tmp_path)))
+    with pytest.raises(ValueError):
+        store.cancer("Skin Cancer")["Survival_Rate"].to_numpy()[0] = 1.0
+
+
+def test_missing_store(tmp_path):
+    assert current_version(str(tmp_path)) is None
+    assert load_store(str(tmp_path)) is None
+    assert get_store(str(tmp_path)) is None
+
+
+def test_writes_swap_versions_and_keep_the_previous_one(tmp_path, frames):
+    path = str(tmp_path)
+    write_store(frames, path)
+    first = current_version(path)
+    old = get_store(path)
+    assert get_store(path) is old
+
+    write_store({"Lung Cancer": frames["Lung Cancer"]}, path)
+    second = current_version(path)
+    assert second != first and versions(path) == sorted([first, second])
+    # A write in this process replaces the store it keeps in memory.
+    store = get_store(path)
+    assert store.version == second and store.cancer_types == ["Lung Cancer"]
+    # A reader still holding the old store can go on reading its files.
+    assert len(old.cancer("Skin Cancer")) == 200
+
+    write_store(frames, path)
+    assert first not in versions(path) and len(versions(path)) == 2
+    assert not [name for name in os.listdir(path) if name.startswith(".tmp-")]
+
+
+def test_another_process_write_is_seen_on_refresh(tmp_path, frames):
+    path = str(tmp_path)
+    write_store(frames, path)
+    store = get_store(path)
+    # What another process's write leaves behind: a new version and pointer.
+    write_store({"Skin Cancer": frames["Skin Cancer"]}, path)
+    newer = current_version(path)
+    with open(os.path.join(path, POINTER), "w") as f:
+        f.write(store.version)
+    assert get_store(path, refresh=True).version == store.version
+    with open(os.path.join(path, POINTER), "w") as f:
+        f.write(newer)
+    assert get_store(path).version == store.version
+    refreshed = get_store(path, refresh=True)
+    assert refreshed.version == newer and refreshed.cancer_types == ["Skin Cancer"]
+    assert get_store(path, refresh=True) is refreshed
+    np.testing.assert_array_equal(refreshed.cancer("Skin Cancer")["Death_Rate"].to_numpy(),
+                                  frames["Skin Cancer"]["Death_Rate"].to_numpy())
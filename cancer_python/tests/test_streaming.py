@@ -0,0 +1,72 @@
+import pandas as pd
+import pytest
+
+import streaming
+from streaming import _line_blocks, stream_ingest
+from synthetic import generate
+
+ROWS = 5_000
+CHUNK = 400
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "synthetic.csv"
+    generate(ROWS, seed=3).to_csv(path, index=False)
+    return str(path)
+
+
+def ingest(csv_path, out_dir, **kwargs):
+    return stream_ingest("Synthetic", csv_path, out_dir=str(out_dir), chunksize=CHUNK,
+                         checkpoint_every=1, progress=False, **kwargs)
+
+
+def test_line_blocks_cover_the_file_in_whole_lines(csv_path):
+    with open(csv_path, "rb") as f:
+        header = f.readline()
+        body = f.read()
+        f.seek(len(header))
+        blocks = list(_line_blocks(f, 100))
+    assert len(blocks) > 1
+    assert b"".join(block for block, _ in blocks) == body
+    end = len(header)
+    for block, offset in blocks:
+        end += len(block)
+        assert block.endswith(b"\n")
+        assert offset == end
+
+
+def test_resumed_ingest_equals_a_single_pass(csv_path, tmp_path, monkeypatch):
+    single = ingest(csv_path, tmp_path / "single")
+
+    fold = streaming.partial_aggregates
+    calls = []
+
+    def interrupted(chunk):
+        calls.append(len(chunk))
+        if len(calls) == 4:
+            raise KeyboardInterrupt
+        return fold(chunk)
+
+    monkeypatch.setattr(streaming, "partial_aggregates", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        ingest(csv_path, tmp_path / "resumed")
+
+    partial = streaming._read(streaming.checkpoint_path("Synthetic", str(tmp_path / "resumed")))
+    assert not partial["complete"] and partial["rows"] == sum(calls[:3])
+    # The resumed run starts at the checkpoint's offset, not at the first row.
+    calls.clear()
+    monkeypatch.setattr(streaming, "partial_aggregates", lambda chunk: calls.append(len(chunk))
+                        or fold(chunk))
+    resumed = ingest(csv_path, tmp_path / "resumed")
+    assert sum(calls) == ROWS - partial["rows"]
+
+    assert resumed["complete"] and resumed["rows"] == single["rows"] == ROWS
+    pd.testing.assert_frame_equal(resumed["partials"].sort_index(), single["partials"].sort_index())
+    assert len(resumed["sample"]) == min(ROWS, streaming.SAMPLE_ROWS)
+
+
+def test_a_complete_checkpoint_is_not_read_again(csv_path, tmp_path, monkeypatch):
+    first = ingest(csv_path, tmp_path)
+    monkeypatch.setattr(streaming, "_line_blocks", None)
+    assert ingest(csv_path, tmp_path)["rows"] == first["rows"]
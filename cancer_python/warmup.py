@@ -0,0 +1,128 @@
+"""Fill the process-wide caches for every cancer page before users arrive.
+
+``start_warmup`` runs once per process in a background thread. It builds the
+manifest and the shared store, pre-resizes the images, and loads every
+cancer's data, cube and figures into their caches. It also computes the
+default comparison. When CANCER_READY_PORT is set, a small HTTP endpoint on
+that port answers 503 until the warm-up has finished and 200 afterwards, with
+the progress as JSON. Point the load balancer's readiness check at it. With
+several worker processes on a node, only the first one to start binds the
+port; the others log that and carry on.
+
+Use ``python serve.py`` to start the warm-up together with the server, rather
+than with the first session. CANCER_WARMUP=0 turns the warm-up off; the
+endpoint then reports ready at once.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from assets import preload
+from compare import comparison
+from data_loader import dataset_version, load_cancer
+from datasets import CANCER_FILES, METRICS
+from filters import get_index
+from figures import page_figure
+from manifest import get_manifest
+from profiling import set_label
+from registry import REGISTRY
+from shared import ensure_shared
+
+ENABLED = os.environ.get("CANCER_WARMUP", "1") != "0"
+READY_PORT = os.environ.get("CANCER_READY_PORT")
+
+logger = logging.getLogger("cancer.warmup")
+
+_ready = threading.Event()
+_status = {"started": None, "finished": None, "warmed": [], "failed": {}}
+_started = False
+_lock = threading.Lock()
+
+
+def warm_cancer(cancer_type):
+    """Load one cancer and build its filter index and every figure of its page."""
+    page = REGISTRY[cancer_type]
+    df = load_cancer(cancer_type)
+    data_version = dataset_version(cancer_type)
+    get_index(cancer_type, df, data_version)
+    for spec in page.charts:
+        page_figure(page, spec, df, data_version)
+
+
+def warm_all():
+    set_label("__warmup__")
+    _status["started"] = time.time()
+    try:
+        get_manifest()
+        ensure_shared()
+        preload()
+    except Exception as exc:
+        # Without a manifest no page can be served, so never report ready.
+        _status["failed"]["__startup__"] = str(exc)
+        logger.exception("warm-up failed")
+        return
+    for cancer_type in CANCER_FILES:
+        try:
+            warm_cancer(cancer_type)
+            _status["warmed"].append(cancer_type)
+        except Exception as exc:
+            _status["failed"][cancer_type] = str(exc)
+            logger.exception("%s: warm-up failed", cancer_type)
+    try:
+        # The comparison view's defaults: every cancer, the first metric, no split.
+        comparison(METRICS[0], None, list(CANCER_FILES))
+    except Exception as exc:
+        _status["failed"]["__compare__"] = str(exc)
+        logger.exception("comparison warm-up failed")
+    _status["finished"] = time.time()
+    logger.info("warm-up finished in %.2fs", _status["finished"] - _status["started"])
+    _ready.set()
+
+
+def is_ready():
+    return _ready.is_set()
+
+
+def status():
+    return dict(_status, ready=is_ready(), warmed=list(_status["warmed"]),
+                failed=dict(_status["failed"]))
+
+
+def start_warmup(port=READY_PORT):
+    """Start the warm-up and the readiness endpoint, once per process."""
+    global _started
+    with _lock:
+        if _started:
+            return
+        _started = True
+    if ENABLED:
+        threading.Thread(target=warm_all, name="cache-warmup", daemon=True).start()
+    else:
+        _ready.set()
+    if port:
+        try:
+            server = ThreadingHTTPServer(("", int(port)), _ReadinessHandler)
+        except OSError as exc:
+            # With several workers per node, the first one to start answers.
+            logger.info("readiness endpoint not started on port %s: %s", port, exc)
+            return
+        threading.Thread(target=server.serve_forever, name="readiness", daemon=True).start()
+
+
+class _ReadinessHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = json.dumps(status()).encode()
+        self.send_response(200 if is_ready() else 503)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
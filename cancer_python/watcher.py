@@ -0,0 +1,133 @@
+"""Background watcher that refreshes one dataset when its CSV changes.
+
+A daemon thread stats every file in CANCER_FILES every CANCER_WATCH_INTERVAL
+seconds (default 2; 0 disables it). A changed size or mtime triggers a
+sha256 check, so a touched but unchanged file costs one hash and nothing
+more. For a file whose content really changed, the new CSV is parsed and
+validated first. If it is broken, it is logged and the old data keeps being
+served. Otherwise the watcher:
+
+* updates the manifest entry of that cancer,
+* replaces that cancer in the shared store, reusing the other cancers' rows,
+* re-streams it if it was ingested with ``ingest.py --stream``,
+* drops that cancer's parsed frame, cube, filter index and cached figures,
+  plus the comparison figures, which span every cancer.
+
+The caches of every other cancer stay warm. Each poll also picks up a new
+store version or streaming checkpoint written by another process, since
+reruns only read the ones held in memory.
+"""
+
+import logging
+import os
+import threading
+
+import pandas as pd
+
+from cube import invalidate as invalidate_cube
+from data_loader import invalidate as invalidate_dataset, normalize
+from datasets import CANCER_FILES
+from figure_cache import figure_cache
+from filters import invalidate as invalidate_index
+from ingest import validate
+from manifest import dataset_entry, get_manifest, update_dataset
+from shared import ENABLED as SHARED_ENABLED, refresh_shared
+from store import get_store
+from streaming import checkpoint_path, reload_checkpoints, stream_ingest
+
+INTERVAL = float(os.environ.get("CANCER_WATCH_INTERVAL", 2))
+
+logger = logging.getLogger("cancer.watcher")
+
+_watcher = None
+_lock = threading.Lock()
+
+
+class DatasetWatcher:
+
+    def __init__(self, interval=INTERVAL):
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        manifest = get_manifest()
+        self._stats = {name: (entry.size, entry.mtime_ns)
+                       for name, entry in manifest.datasets.items()}
+        # The content this watcher last served. The manifest itself may already
+        # have been brought up to date by shared.ensure_shared.
+        self._hashes = {name: entry.sha256 for name, entry in manifest.datasets.items()}
+
+    def check(self):
+        """Refresh every dataset whose file changed; returns the refreshed cancer types."""
+        get_store(refresh=True)
+        reload_checkpoints()
+        refreshed = []
+        for cancer_type in CANCER_FILES:
+            path = get_manifest().datasets[cancer_type].path
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue  # mid-replace, or removed; look again next time
+            if (stat.st_size, stat.st_mtime_ns) == self._stats.get(cancer_type):
+                continue
+            self._stats[cancer_type] = (stat.st_size, stat.st_mtime_ns)
+            try:
+                if refresh(cancer_type, self._hashes.get(cancer_type)):
+                    refreshed.append(cancer_type)
+                self._hashes[cancer_type] = get_manifest().datasets[cancer_type].sha256
+            except (OSError, ValueError) as exc:
+                logger.warning("%s: keeping the previous data: %s", cancer_type, exc)
+        return refreshed
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="dataset-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("dataset watcher check failed")
+
+
+def refresh(cancer_type, previous=None):
+    """Bring one dataset up to date everywhere; returns False if its content is unchanged.
+
+    ``previous`` is the sha256 of the content being served, by default the
+    manifest's.
+    """
+    entry = dataset_entry(cancer_type)
+    if previous is None:
+        previous = get_manifest().datasets[cancer_type].sha256
+    if entry.sha256 == previous:
+        update_dataset(entry)
+        return False
+
+    df = normalize(pd.read_csv(entry.path))
+    validate(df, cancer_type)
+    update_dataset(entry)
+    if SHARED_ENABLED:
+        refresh_shared(cancer_type, df, entry)
+    if os.path.exists(checkpoint_path(cancer_type)):
+        stream_ingest(cancer_type, progress=False)
+
+    invalidate_dataset(entry.path)
+    invalidate_cube(cancer_type)
+    invalidate_index(cancer_type)
+    figure_cache.invalidate(cancer_type)
+    figure_cache.invalidate("__compare__")
+    logger.info("%s: refreshed from %s", cancer_type, os.path.basename(entry.path))
+    return True
+
+
+def start_watcher(interval=INTERVAL):
+    """Start the process-wide watcher once; returns None when watching is disabled."""
+    global _watcher
+    with _lock:
+        if _watcher is None and interval > 0:
+            _watcher = DatasetWatcher(interval).start()
+        return _watcher